@@ -1,8 +1,52 @@
+import math
 from abc import ABCMeta
-from typing import List
+from bisect import bisect_left, insort
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+class MenuStats:
+    def __init__(
+        self,
+        count: int = 0,
+        vegetarian_count: int = 0,
+        price_sum: float = 0.0,
+        min_price: float = math.inf,
+        max_price: float = -math.inf,
+    ) -> None:
+        self.count: int = count
+        self.vegetarian_count: int = vegetarian_count
+        self.price_sum: float = price_sum
+        self.min_price: float = min_price
+        self.max_price: float = max_price
+
+    def get_average_price(self) -> float:
+        return self.price_sum / self.count if self.count else math.nan
+
+    def merge(self, other: 'MenuStats') -> None:
+        self.count += other.count
+        self.vegetarian_count += other.vegetarian_count
+        self.price_sum += other.price_sum
+        self.min_price = min(self.min_price, other.min_price)
+        self.max_price = max(self.max_price, other.max_price)
+
+    def subtract(self, other: 'MenuStats') -> bool:
+        self.count -= other.count
+        self.vegetarian_count -= other.vegetarian_count
+        self.price_sum = self.price_sum - other.price_sum if self.count else 0.0
+        return other.min_price <= self.min_price or other.max_price >= self.max_price
+
+    def __str__(self) -> str:
+        if not self.count:
+            return 'items: 0'
+        return (
+            f'items: {self.count}, vegetarian: {self.vegetarian_count}, '
+            f'min/max/avg price: {self.min_price}/{self.max_price}/{self.get_average_price():.2f}'
+        )
 
 
 class MenuComponent(metaclass=ABCMeta):
+    parent: Optional['Menu'] = None
+
     def add(self, menu_component) -> None:
         raise RuntimeError()
 
@@ -27,18 +71,63 @@ class MenuComponent(metaclass=ABCMeta):
     def print(self) -> None:
         raise RuntimeError()
 
+    def get_stats(self) -> MenuStats:
+        raise RuntimeError()
+
 
 class Menu(MenuComponent):
+    index: Optional['MenuIndex'] = None
+
     def __init__(self, name: str, description: str) -> None:
         self.name: str = name
         self.description: str = description
         self.menu_components: List[MenuComponent] = []
+        self._stats: MenuStats = MenuStats()
 
     def add(self, menu_component: MenuComponent) -> None:
         self.menu_components.append(menu_component)
+        menu_component.parent = self
+        stats: MenuStats = menu_component.get_stats()
+        node: Optional[Menu] = self
+        while node is not None:
+            node._stats.merge(stats)
+            node = node.parent
+        for index in self.find_indexes():
+            index.add_subtree(menu_component)
 
     def remove(self, menu_component: MenuComponent) -> None:
+        if menu_component in self.menu_components:
+            for index in self.find_indexes():
+                index.remove_subtree(menu_component)
         self.menu_components.remove(menu_component)
+        menu_component.parent = None
+        stats: MenuStats = menu_component.get_stats()
+        node: Optional[Menu] = self
+        while node is not None:
+            if node._stats.subtract(stats):
+                node._recompute_bounds()
+            node = node.parent
+
+    def find_index(self) -> Optional['MenuIndex']:
+        indexes: List[MenuIndex] = self.find_indexes()
+        return indexes[0] if indexes else None
+
+    def find_indexes(self) -> List['MenuIndex']:
+        indexes: List[MenuIndex] = []
+        node: Optional[Menu] = self
+        while node is not None:
+            if node.index is not None:
+                indexes.append(node.index)
+            node = node.parent
+        return indexes
+
+    def _recompute_bounds(self) -> None:
+        children: List[MenuStats] = [child.get_stats() for child in self.menu_components]
+        self._stats.min_price = min((child.min_price for child in children), default=math.inf)
+        self._stats.max_price = max((child.max_price for child in children), default=-math.inf)
+
+    def get_stats(self) -> MenuStats:
+        return self._stats
 
     def get_child(self, i: int) -> MenuComponent:
         return self.menu_components[i]
@@ -74,11 +163,127 @@ class MenuItem(MenuComponent):
     def is_vegetarian(self) -> bool:
         return self.vegetarian
 
+    def get_stats(self) -> MenuStats:
+        return MenuStats(1, int(self.vegetarian), self.price, self.price, self.price)
+
     def print(self) -> None:
         print(f"  {self.get_name()} {'(v)' if self.is_vegetarian() else ''}, {self.get_price()}")
         print(f"     -- {self.get_description()}")
 
 
+class MenuIndex:
+    SEPARATOR: str = '/'
+
+    def __init__(self, root: Menu) -> None:
+        if root.index is not None:
+            raise ValueError(f'{root.get_name()} already has an index')
+        self.root: Menu = root
+        self._components: Dict[int, MenuComponent] = {}
+        self._paths: Dict[str, List[MenuComponent]] = {}
+        self._names: Dict[str, List[MenuComponent]] = {}
+        self._sorted_names: List[Tuple[str, int]] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+        root.index = self
+        self.add_subtree(root)
+
+    def path_of(self, menu_component: MenuComponent) -> str:
+        names: List[str] = []
+        node: Optional[MenuComponent] = menu_component
+        while node is not None and node is not self.root:
+            names.append(node.get_name())
+            node = node.parent
+        names.append(self.root.get_name())
+        return self.SEPARATOR.join(reversed(names))
+
+    def _walk(self, menu_component: MenuComponent) -> Iterator[Tuple[MenuComponent, str]]:
+        stack: List[Tuple[MenuComponent, str]] = [(menu_component, self.path_of(menu_component))]
+        while stack:
+            node, path = stack.pop()
+            yield node, path
+            if isinstance(node, Menu):
+                stack.extend((child, f'{path}{self.SEPARATOR}{child.get_name()}') for child in node.menu_components)
+
+    @staticmethod
+    def _trigrams_of(name: str) -> Set[str]:
+        return {name[i:i + 3] for i in range(len(name) - 2)}
+
+    def add_subtree(self, menu_component: MenuComponent) -> None:
+        entries: List[Tuple[str, int]] = []
+        for node, path in self._walk(menu_component):
+            key: int = id(node)
+            name: str = node.get_name()
+            lowered: str = name.lower()
+            self._components[key] = node
+            self._paths.setdefault(path, []).append(node)
+            self._names.setdefault(name, []).append(node)
+            entries.append((lowered, key))
+            for trigram in self._trigrams_of(lowered):
+                self._trigrams.setdefault(trigram, set()).add(key)
+        if len(entries) == 1:
+            insort(self._sorted_names, entries[0])
+        else:
+            self._sorted_names.extend(entries)
+            self._sorted_names.sort()
+
+    def remove_subtree(self, menu_component: MenuComponent) -> None:
+        removed: List[Tuple[str, int]] = []
+        for node, path in self._walk(menu_component):
+            key: int = id(node)
+            name: str = node.get_name()
+            lowered: str = name.lower()
+            del self._components[key]
+            self._discard(self._paths, path, node)
+            self._discard(self._names, name, node)
+            removed.append((lowered, key))
+            for trigram in self._trigrams_of(lowered):
+                keys: Set[int] = self._trigrams[trigram]
+                keys.discard(key)
+                if not keys:
+                    del self._trigrams[trigram]
+        if len(removed) == 1:
+            del self._sorted_names[bisect_left(self._sorted_names, removed[0])]
+        else:
+            removed_keys: Set[int] = {key for _, key in removed}
+            self._sorted_names = [entry for entry in self._sorted_names if entry[1] not in removed_keys]
+
+    @staticmethod
+    def _discard(mapping: Dict[str, List[MenuComponent]], key: str, menu_component: MenuComponent) -> None:
+        components: List[MenuComponent] = mapping[key]
+        components.remove(menu_component)
+        if not components:
+            del mapping[key]
+
+    def find(self, path: str) -> Optional[MenuComponent]:
+        components: List[MenuComponent] = self._paths.get(path, [])
+        return components[0] if components else None
+
+    def find_by_name(self, name: str) -> List[MenuComponent]:
+        return list(self._names.get(name, ()))
+
+    def search_prefix(self, prefix: str, limit: Optional[int] = None) -> List[MenuComponent]:
+        prefix = prefix.lower()
+        matches: List[MenuComponent] = []
+        for i in range(bisect_left(self._sorted_names, (prefix,)), len(self._sorted_names)):
+            lowered, key = self._sorted_names[i]
+            if not lowered.startswith(prefix) or len(matches) == limit:
+                break
+            matches.append(self._components[key])
+        return matches
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[MenuComponent]:
+        text = text.lower()
+        trigrams: Set[str] = self._trigrams_of(text)
+        if trigrams:
+            candidates: Set[int] = set.intersection(*(self._trigrams.get(t, set()) for t in trigrams))
+        else:
+            candidates = set(self._components)
+        matches: List[Tuple[str, int]] = sorted(
+            (lowered, key) for lowered, key in
+            ((self._components[key].get_name().lower(), key) for key in candidates) if text in lowered
+        )
+        return [self._components[key] for _, key in matches[:limit]]
+
+
 class Waitress:
     def __init__(self, all_menus: MenuComponent) -> None:
         self.all_menus: MenuComponent = all_menus
@@ -139,3 +344,14 @@ if __name__ == '__main__':
     waitress: Waitress = Waitress(all_menus)
 
     waitress.print_menu()
+
+    print(f'\nALL MENUS: {all_menus.get_stats()}')
+    print(f'DINER MENU: {diner_menu.get_stats()}')
+    cafe_menu.remove(coffee_menu)
+    print(f'ALL MENUS without coffee: {all_menus.get_stats()}')
+
+    menu_index: MenuIndex = MenuIndex(all_menus)
+    cafe_menu.add(coffee_menu)
+    print(f'\nSoup search: {[menu_index.path_of(c) for c in menu_index.search("soup")]}')
+    print(f'Prefix "B": {[c.get_name() for c in menu_index.search_prefix("b")]}')
+    print(f'Path lookup: {menu_index.find("ALL MENUS/CAFE MENU/COFFEE MENU/Bagel").get_description()}')
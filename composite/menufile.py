@@ -0,0 +1,284 @@
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from menu import Menu, MenuComponent, MenuItem, MenuStats
+
+MAGIC: bytes = b'MENU'
+VERSION: int = 1
+HEADER: str = '<4sIII'
+HEADER_SIZE: int = 16
+KIND_MENU: int = 1
+KIND_VEGETARIAN: int = 2
+
+
+def _pad(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _walk(root: MenuComponent) -> Iterator[Tuple[MenuComponent, int]]:
+    stack: List[Tuple[MenuComponent, int]] = [(root, -1)]
+    index: int = 0
+    while stack:
+        component, parent = stack.pop()
+        yield component, parent
+        if isinstance(component, Menu):
+            stack.extend((child, index) for child in reversed(component.menu_components))
+        index += 1
+
+
+def dump_tree(root: MenuComponent, f: BinaryIO) -> None:
+    strings: Dict[str, int] = {}
+    prices: array = array('d')
+    sizes: array = array('I')
+    names: array = array('I')
+    descriptions: array = array('I')
+    kinds: bytearray = bytearray()
+    parents: List[int] = []
+
+    for component, parent in _walk(root):
+        parents.append(parent)
+        names.append(strings.setdefault(component.get_name(), len(strings)))
+        descriptions.append(strings.setdefault(component.get_description(), len(strings)))
+        sizes.append(1)
+        if isinstance(component, Menu):
+            kinds.append(KIND_MENU)
+            prices.append(math.nan)
+        else:
+            kinds.append(KIND_VEGETARIAN if component.is_vegetarian() else 0)
+            prices.append(component.get_price())
+    for i in range(len(parents) - 1, 0, -1):
+        sizes[parents[i]] += sizes[i]
+
+    blob: bytes = b''.join(s.encode() for s in strings)
+    offsets: array = array('I', [0])
+    for s in strings:
+        offsets.append(offsets[-1] + len(s.encode()))
+
+    f.write(_header(len(prices), len(strings)))
+    for column in (prices, sizes, names, descriptions, offsets, kinds):
+        data: bytes = bytes(column) if isinstance(column, bytearray) else column.tobytes()
+        f.write(data + b'\0' * (_pad(len(data)) - len(data)))
+    f.write(blob)
+
+
+def _header(node_count: int, string_count: int) -> bytes:
+    return struct.pack(HEADER, MAGIC, VERSION, node_count, string_count)
+
+
+class MenuTree:
+    def __init__(self, path: str) -> None:
+        if sys.byteorder != 'little':
+            raise RuntimeError('menu files are little-endian')
+        self.path: str = path
+        self._file = open(path, 'rb')
+        self._mmap: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view: memoryview = memoryview(self._mmap)
+        magic, version, node_count, string_count = struct.unpack_from(HEADER, view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} menu file')
+
+        offset: int = HEADER_SIZE
+
+        def column(fmt: str, itemsize: int, count: int) -> memoryview:
+            nonlocal offset
+            data: memoryview = view[offset:offset + itemsize * count].cast(fmt)
+            offset += _pad(itemsize * count)
+            return data
+
+        self.prices: memoryview = column('d', 8, node_count)
+        self.sizes: memoryview = column('I', 4, node_count)
+        self.names: memoryview = column('I', 4, node_count)
+        self.descriptions: memoryview = column('I', 4, node_count)
+        self.string_offsets: memoryview = column('I', 4, string_count + 1)
+        self.kinds: memoryview = column('B', 1, node_count)
+        self.strings: memoryview = view[offset:]
+        self._string_cache: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def string(self, i: int) -> str:
+        s: Optional[str] = self._string_cache.get(i)
+        if s is None:
+            s = self._string_cache[i] = str(self.strings[self.string_offsets[i]:self.string_offsets[i + 1]], 'utf-8')
+        return s
+
+    def children(self, index: int) -> Iterator[int]:
+        child: int = index + 1
+        end: int = index + self.sizes[index]
+        while child < end:
+            yield child
+            child += self.sizes[child]
+
+    def node(self, index: int, parent: Optional[Menu] = None) -> MenuComponent:
+        kind: int = self.kinds[index]
+        if kind & KIND_MENU:
+            component: MenuComponent = LazyMenu(self, index)
+        else:
+            component = MenuItem(
+                self.string(self.names[index]), self.string(self.descriptions[index]),
+                bool(kind & KIND_VEGETARIAN), self.prices[index]
+            )
+        component.parent = parent
+        return component
+
+    def subtree_stats(self, index: int) -> MenuStats:
+        stats: MenuStats = MenuStats()
+        for i in range(index + 1, index + self.sizes[index]):
+            kind: int = self.kinds[i]
+            if kind & KIND_MENU:
+                continue
+            price: float = self.prices[i]
+            stats.merge(MenuStats(1, int(bool(kind & KIND_VEGETARIAN)), price, price, price))
+        return stats
+
+    def root(self) -> MenuComponent:
+        return self.node(0)
+
+    def partition(self, parts: int) -> List[Tuple[int, int]]:
+        target: int = -(-(len(self) - 1) // parts)
+        ranges: List[Tuple[int, int]] = []
+        start: int = 1
+        end: int = 1
+        for child in self.children(0):
+            end = child + self.sizes[child]
+            if end - start >= target:
+                ranges.append((start, end))
+                start = end
+        if start < end:
+            ranges.append((start, end))
+        return ranges
+
+    def resolve(self, root: MenuComponent, indices: Sequence[int]) -> List[MenuComponent]:
+        found: List[MenuComponent] = []
+        stack: List[Tuple[MenuComponent, int]] = [(root, 0)]
+        while stack:
+            component, index = stack.pop()
+            first: int = bisect_left(indices, index)
+            if first == len(indices) or indices[first] >= index + self.sizes[index]:
+                continue
+            if indices[first] == index:
+                found.append(component)
+            if self.kinds[index] & KIND_MENU:
+                stack.extend(reversed(list(zip(component.menu_components, self.children(index)))))
+        return found
+
+    def close(self) -> None:
+        for column in (self.prices, self.sizes, self.names, self.descriptions, self.string_offsets, self.kinds,
+                       self.strings):
+            column.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MenuTree':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LazyMenu(Menu):
+    def __init__(self, tree: MenuTree, index: int) -> None:
+        self._tree: MenuTree = tree
+        self._index: int = index
+        self._components: Optional[List[MenuComponent]] = None
+        self._stats_cache: Optional[MenuStats] = None
+
+    @property
+    def name(self) -> str:
+        return self._tree.string(self._tree.names[self._index])
+
+    @property
+    def description(self) -> str:
+        return self._tree.string(self._tree.descriptions[self._index])
+
+    @property
+    def menu_components(self) -> List[MenuComponent]:
+        if self._components is None:
+            self._components = [self._tree.node(child, self) for child in self._tree.children(self._index)]
+        return self._components
+
+    @property
+    def _stats(self) -> MenuStats:
+        if self._stats_cache is None:
+            self._stats_cache = self._tree.subtree_stats(self._index)
+        return self._stats_cache
+
+
+NodePredicate = Callable[[MenuTree, int], bool]
+
+
+def is_vegetarian_node(tree: MenuTree, index: int) -> bool:
+    return bool(tree.kinds[index] & KIND_VEGETARIAN)
+
+
+def _scan(tree: MenuTree, start: int, end: int, predicate: NodePredicate) -> List[int]:
+    return [i for i in range(start, end) if predicate(tree, i)]
+
+
+def filter_range(path: str, start: int, end: int, predicate: NodePredicate) -> List[int]:
+    with MenuTree(path) as tree:
+        return _scan(tree, start, end, predicate)
+
+
+def filter_tree(
+    tree: MenuTree, predicate: NodePredicate = is_vegetarian_node, workers: Optional[int] = 1
+) -> List[int]:
+    if workers == 1:
+        return _scan(tree, 1, len(tree), predicate)
+    ranges: List[Tuple[int, int]] = tree.partition((workers or os.cpu_count() or 1) * 4)
+    if len(ranges) < 2:
+        return _scan(tree, 1, len(tree), predicate)
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(workers) as executor:
+        results = executor.map(filter_range, [tree.path] * len(ranges), starts, ends, [predicate] * len(ranges))
+        return [i for matches in results for i in matches]
+
+
+def build_catalog(menus: int, items_per_menu: int) -> Menu:
+    root: Menu = Menu('ALL MENUS', 'All menus combined')
+    for m in range(menus):
+        menu: Menu = Menu(f'MENU {m}', f'Menu number {m}')
+        for i in range(items_per_menu):
+            menu.add(MenuItem(f'Item {m}.{i}', f'Description {i % 100}', i % 3 == 0, 1.0 + i % 500 / 100))
+        root.add(menu)
+    return root
+
+
+if __name__ == '__main__':
+    path: str = sys.argv[1] if len(sys.argv) > 1 else 'menu.bin'
+
+    start: float = time.perf_counter()
+    catalog: Menu = build_catalog(200, 1000)
+    built: float = time.perf_counter() - start
+    with open(path, 'wb') as out:
+        dump_tree(catalog, out)
+
+    start = time.perf_counter()
+    with MenuTree(path) as tree:
+        root: MenuComponent = tree.root()
+        first: MenuComponent = root.get_child(0).get_child(0)
+        loaded: float = time.perf_counter() - start
+        print(f'built {len(tree):,} nodes with add() in {built * 1000:.1f}ms, '
+              f'opened and reached {first.get_name()!r} in {loaded * 1000:.2f}ms')
+        print(f'ALL MENUS: {root.get_stats()}')
+        print(f'MENU 0: {root.get_child(0).get_stats()}')
+
+        for workers in (1, max(2, os.cpu_count() or 1)):
+            start = time.perf_counter()
+            matches: List[int] = filter_tree(tree, is_vegetarian_node, workers)
+            scanned: float = time.perf_counter() - start
+            print(f'filter_tree x{workers}: {len(matches):,} vegetarian items in {scanned * 1000:.1f}ms')
+        start = time.perf_counter()
+        vegetarian: List[MenuComponent] = tree.resolve(root, matches)
+        print(f'resolved {len(vegetarian):,} nodes in {(time.perf_counter() - start) * 1000:.1f}ms, '
+              f'first {vegetarian[0].get_name()!r} is root.get_child(0).get_child(0): '
+              f'{vegetarian[0] is root.get_child(0).get_child(0)}')
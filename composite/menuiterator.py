@@ -1,9 +1,11 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable
-from typing import List
+from typing import Callable, List
 
 
 class MenuComponent(metaclass=ABCMeta):
+    is_composite: bool = False
+
     def add(self, menu_component) -> None:
         raise RuntimeError()
 
@@ -45,34 +47,41 @@ class Iterator(metaclass=ABCMeta):
 
 class CompositeIterator:
     def __init__(self, iterator: List[MenuComponent]) -> None:
-        self.stack: List[List[MenuComponent]] = []
-        self.stack.append(iterator)
+        self.stack: List[List[MenuComponent]] = [iterator]
+        self.positions: List[int] = [0]
 
     def __len__(self) -> int:
         return len(self.stack)
 
-    def pop(self, p: int = 0) -> None:
+    def pop(self, p: int = -1) -> None:
         self.stack.pop(p)
+        self.positions.pop(p)
 
     def __iter__(self):
         return self
 
     def __next__(self) -> MenuComponent:
-        if len(self.stack) < 1:
-            raise StopIteration()
-        else:
-            iterator = self.stack[-1]
-            print(iterator)
-            if len(iterator) > 0:
-                component = iterator.pop()
-                self.stack.append(component.create_iterator())
+        stack: List[List[MenuComponent]] = self.stack
+        positions: List[int] = self.positions
+        while stack:
+            components: List[MenuComponent] = stack[-1]
+            position: int = positions[-1]
+            if position < len(components):
+                positions[-1] = position + 1
+                component: MenuComponent = components[position]
+                children: List[MenuComponent] = component.create_iterator()
+                if children:
+                    stack.append(children)
+                    positions.append(0)
                 return component
-            else:
-                self.stack.pop(-1)
-                return self.__next__()
+            stack.pop()
+            positions.pop()
+        raise StopIteration()
 
 
 class Menu(MenuComponent):
+    is_composite: bool = True
+
     def __init__(self, name: str, description: str) -> None:
         self.name: str = name
         self.description: str = description
@@ -132,6 +141,16 @@ class MenuItem(MenuComponent):
         print(f"     -- {self.get_description()}")
 
 
+def is_vegetarian_item(menu_component: MenuComponent) -> bool:
+    return not menu_component.is_composite and menu_component.is_vegetarian()
+
+
+def filter_components(
+    root: MenuComponent, predicate: Callable[[MenuComponent], bool] = is_vegetarian_item
+) -> List[MenuComponent]:
+    return [c for c in CompositeIterator(root.create_iterator()) if predicate(c)]
+
+
 class Waitress:
     def __init__(self, all_menus: MenuComponent) -> None:
         self.all_menus: MenuComponent = all_menus
@@ -140,19 +159,9 @@ class Waitress:
         self.all_menus.print()
 
     def print_vegetarian_menu(self) -> None:
-        def _print_menu(iterator):
-            for menu_component in iterator:
-                try:
-                    if menu_component.is_vegetarian():
-                        menu_component.print()
-                except RuntimeError:
-                    pass
-                _print_menu(menu_component.create_iterator())
-
-        iterator = self.all_menus.create_iterator()
-
         print("\nVEGETARIAN MENU\n----")
-        _print_menu(iterator)
+        for menu_component in filter_components(self.all_menus, is_vegetarian_item):
+            menu_component.print()
 
 
 if __name__ == '__main__':
@@ -1,5 +1,12 @@
+import copy
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import List
+from collections import Counter
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type, TypeVar
+
+T = TypeVar('T')
+P = TypeVar('P', bound=Type['Pizza'])
 
 
 class Dough(metaclass=ABCMeta):
@@ -106,7 +113,115 @@ class FrozenClams(Clams):
         return 'Frozen Clams from Chesapeake Bay'
 
 
+class IngredientPool:
+    def __init__(self) -> None:
+        self._instances: Dict[type, object] = {}
+        self._groups: Dict[Tuple[type, ...], tuple] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, cls: Type[T]) -> T:
+        instance = self._instances.get(cls)
+        if instance is None:
+            self.misses += 1
+            instance = self._instances[cls] = cls()
+        else:
+            self.hits += 1
+        return instance
+
+    def get_all(self, classes: Tuple[type, ...]) -> tuple:
+        group = self._groups.get(classes)
+        if group is None:
+            group = self._groups[classes] = tuple(self.get(cls) for cls in classes)
+        else:
+            self.hits += len(classes)
+        return group
+
+    def __str__(self) -> str:
+        return f'ingredient pool: {self.misses} allocations, {self.hits} allocations saved'
+
+
+class FreshIngredientPool(IngredientPool):
+    def get(self, cls: Type[T]) -> T:
+        self.misses += 1
+        return cls()
+
+    def get_all(self, classes: Tuple[type, ...]) -> tuple:
+        return tuple(self.get(cls) for cls in classes)
+
+
+INGREDIENT_POOL: IngredientPool = IngredientPool()
+
+
+class OutOfStockError(Exception):
+    pass
+
+
+class Inventory:
+    def __init__(self, stripes: int = 16) -> None:
+        self._locks: Tuple[threading.Lock, ...] = tuple(threading.Lock() for _ in range(stripes))
+        self._stock: Dict[str, int] = {}
+
+    def _stripe(self, ingredient: str) -> int:
+        return hash(ingredient) % len(self._locks)
+
+    def _acquire(self, ingredients: Iterable[str]) -> List[threading.Lock]:
+        locks: List[threading.Lock] = [self._locks[i] for i in sorted({self._stripe(name) for name in ingredients})]
+        for lock in locks:
+            lock.acquire()
+        return locks
+
+    @staticmethod
+    def _release(locks: List[threading.Lock]) -> None:
+        for lock in reversed(locks):
+            lock.release()
+
+    def get(self, ingredient: str) -> int:
+        with self._locks[self._stripe(ingredient)]:
+            return self._stock.get(ingredient, 0)
+
+    def restock(self, amounts: Dict[str, int]) -> None:
+        locks: List[threading.Lock] = self._acquire(amounts)
+        try:
+            for ingredient, amount in amounts.items():
+                self._stock[ingredient] = self._stock.get(ingredient, 0) + amount
+        finally:
+            self._release(locks)
+
+    def reserve(self, amounts: Dict[str, int]) -> None:
+        locks: List[threading.Lock] = self._acquire(amounts)
+        try:
+            missing: List[str] = [name for name, amount in amounts.items() if self._stock.get(name, 0) < amount]
+            if missing:
+                raise OutOfStockError(f'out of stock: {", ".join(missing)}')
+            for ingredient, amount in amounts.items():
+                self._stock[ingredient] -= amount
+        finally:
+            self._release(locks)
+
+
 class PizzaIngredientFactory(metaclass=ABCMeta):
+    INGREDIENTS: Dict[str, Tuple[type, ...]] = {}
+
+    def __init__(self, pool: Optional[IngredientPool] = None, inventory: Optional[Inventory] = None) -> None:
+        self.pool: IngredientPool = INGREDIENT_POOL if pool is None else pool
+        self.inventory: Optional[Inventory] = inventory
+
+    def requirements(self, kinds: Iterable[str], count: int = 1) -> Dict[str, int]:
+        amounts: Dict[str, int] = {}
+        for kind in kinds:
+            for ingredient in self.INGREDIENTS[kind]:
+                amounts[ingredient.__name__] = amounts.get(ingredient.__name__, 0) + count
+        return amounts
+
+    def reserve(self, kinds: Iterable[str], count: int = 1) -> None:
+        if self.inventory is not None:
+            self.inventory.reserve(self.requirements(kinds, count))
+
+    def unreserve(self, kinds: Iterable[str], count: int = 1) -> None:
+        if self.inventory is not None and count:
+            self.inventory.restock(self.requirements(kinds, count))
+
     @abstractmethod
     def create_dough(self) -> Dough:
         raise NotImplementedError('create_dough method not implemented')
@@ -120,7 +235,7 @@ class PizzaIngredientFactory(metaclass=ABCMeta):
         raise NotImplementedError('create_cheese method not implemented')
 
     @abstractmethod
-    def create_veggies(self) -> List[Veggies]:
+    def create_veggies(self) -> Sequence[Veggies]:
         raise NotImplementedError('create_veggies method not implemented')
 
     @abstractmethod
@@ -133,54 +248,82 @@ class PizzaIngredientFactory(metaclass=ABCMeta):
 
 
 class NYPizzaIngredientFactory(PizzaIngredientFactory):
+    VEGGIES: Tuple[Type[Veggies], ...] = (Garlic, Onion, Mushroom, RedPepper)
+    INGREDIENTS: Dict[str, Tuple[type, ...]] = {
+        'dough': (ThinCrustDough,),
+        'sauce': (MarinaraSauce,),
+        'cheese': (ReggianoCheese,),
+        'veggies': VEGGIES,
+        'pepperoni': (SlicedPepperoni,),
+        'clam': (FreshClams,),
+    }
 
     def create_dough(self) -> Dough:
-        return ThinCrustDough()
+        return self.pool.get(ThinCrustDough)
 
     def create_sauce(self) -> Sauce:
-        return MarinaraSauce()
+        return self.pool.get(MarinaraSauce)
 
     def create_cheese(self) -> Cheese:
-        return ReggianoCheese()
+        return self.pool.get(ReggianoCheese)
 
-    def create_veggies(self) -> List[Veggies]:
-        veggies = [Garlic(), Onion(), Mushroom(), RedPepper()]
-        return veggies
+    def create_veggies(self) -> Sequence[Veggies]:
+        return self.pool.get_all(self.VEGGIES)
 
     def create_pepperoni(self) -> Pepperoni:
-        return SlicedPepperoni()
+        return self.pool.get(SlicedPepperoni)
 
     def create_clam(self) -> Clams:
-        return FreshClams()
+        return self.pool.get(FreshClams)
 
 
 class ChicagoPizzaIngredientFactory(PizzaIngredientFactory):
+    VEGGIES: Tuple[Type[Veggies], ...] = (BlackOlives, Spinach, Eggplant)
+    INGREDIENTS: Dict[str, Tuple[type, ...]] = {
+        'dough': (ThickCrustDough,),
+        'sauce': (PlumTomatoSauce,),
+        'cheese': (MozzarellaCheese,),
+        'veggies': VEGGIES,
+        'pepperoni': (SlicedPepperoni,),
+        'clam': (FrozenClams,),
+    }
+
     def create_dough(self) -> Dough:
-        return ThickCrustDough()
+        return self.pool.get(ThickCrustDough)
 
     def create_sauce(self) -> Sauce:
-        return PlumTomatoSauce()
+        return self.pool.get(PlumTomatoSauce)
 
     def create_cheese(self) -> Cheese:
-        return MozzarellaCheese()
+        return self.pool.get(MozzarellaCheese)
 
-    def create_veggies(self) -> List[Veggies]:
-        veggies = [BlackOlives(), Spinach(), Eggplant()]
-        return veggies
+    def create_veggies(self) -> Sequence[Veggies]:
+        return self.pool.get_all(self.VEGGIES)
 
     def create_pepperoni(self) -> Pepperoni:
-        return SlicedPepperoni()
+        return self.pool.get(SlicedPepperoni)
 
     def create_clam(self) -> Clams:
-        return FrozenClams()
+        return self.pool.get(FrozenClams)
 
 
 class Pizza(metaclass=ABCMeta):
+    ingredients: Tuple[str, ...] = ()
+
     def __init__(self) -> None:
+        self.reset()
+
+    def reserve_ingredients(self, count: int = 1) -> None:
+        self.ingredient_factory.reserve(self.ingredients, count)
+
+    def unreserve_ingredients(self, count: int = 1) -> None:
+        self.ingredient_factory.unreserve(self.ingredients, count)
+
+    def reset(self) -> None:
         self.name = ''
         self.dough = None
         self.sauce = None
-        self.veggies: List[Veggies] = []
+        self.veggies: Sequence[Veggies] = ()
         self.cheese = None
         self.pepperoni = None
         self.clam = None
@@ -188,6 +331,9 @@ class Pizza(metaclass=ABCMeta):
     def set_name(self, name: str):
         self.name = name
 
+    def clone(self) -> 'Pizza':
+        return copy.copy(self)
+
     def get_name(self):
         return self.name
 
@@ -224,7 +370,96 @@ class Pizza(metaclass=ABCMeta):
         return '\n'.join(display)
 
 
+class PizzaPool:
+    def __init__(self, max_size: int = 64) -> None:
+        self.max_size: int = max_size
+        self._free: Dict[type, List[Pizza]] = {}
+        self._pooled: Set[int] = set()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.discarded: int = 0
+
+    def prewarm(self, pizza_class: Type[Pizza], ingredient_factory: PizzaIngredientFactory, count: int) -> None:
+        free: List[Pizza] = self._free.setdefault(pizza_class, [])
+        while len(free) < min(count, self.max_size):
+            pizza: Pizza = pizza_class(ingredient_factory)
+            self._pooled.add(id(pizza))
+            free.append(pizza)
+
+    def acquire(self, pizza_class: Type[Pizza], ingredient_factory: PizzaIngredientFactory) -> Pizza:
+        free: Optional[List[Pizza]] = self._free.get(pizza_class)
+        if free:
+            self.hits += 1
+            pizza: Pizza = free.pop()
+            self._pooled.discard(id(pizza))
+            pizza.ingredient_factory = ingredient_factory
+            return pizza
+        self.misses += 1
+        return pizza_class(ingredient_factory)
+
+    def release(self, pizza: Pizza) -> None:
+        if id(pizza) in self._pooled:
+            raise ValueError(f'{type(pizza).__name__} was already released to the pool')
+        free: List[Pizza] = self._free.setdefault(type(pizza), [])
+        if len(free) >= self.max_size:
+            self.discarded += 1
+            return
+        pizza.reset()
+        self._pooled.add(id(pizza))
+        free.append(pizza)
+
+    def __str__(self) -> str:
+        return f'pizza pool: {self.hits} hits, {self.misses} misses, {self.discarded} discarded'
+
+
+class PizzaRegistry:
+    def __init__(self, parent: Optional['PizzaRegistry'] = None) -> None:
+        self.parent: Optional[PizzaRegistry] = parent
+        self._types: Dict[str, Tuple[Type[Pizza], str]] = {}
+
+    def add(self, pizza_type: str, pizza_class: Type[Pizza], label: str) -> None:
+        self._types[pizza_type] = (pizza_class, label)
+
+    def register(self, pizza_type: str, label: str) -> Callable[[P], P]:
+        def decorator(pizza_class: P) -> P:
+            self.add(pizza_type, pizza_class, label)
+            return pizza_class
+        return decorator
+
+    def get(self, pizza_type: str) -> Tuple[Type[Pizza], str]:
+        entry: Optional[Tuple[Type[Pizza], str]] = self._types.get(pizza_type)
+        if entry is None:
+            if self.parent is None:
+                raise Exception(f'no such kind pizza type: {pizza_type}')
+            return self.parent.get(pizza_type)
+        return entry
+
+    def create(
+        self,
+        pizza_type: str,
+        ingredient_factory: PizzaIngredientFactory,
+        style: str,
+        pool: Optional[PizzaPool] = None,
+    ) -> Pizza:
+        pizza_class, label = self.get(pizza_type)
+        if pool is None:
+            pizza: Pizza = pizza_class(ingredient_factory)
+        else:
+            pizza = pool.acquire(pizza_class, ingredient_factory)
+        pizza.set_name(f'{style} {label}')
+        return pizza
+
+    def __contains__(self, pizza_type: str) -> bool:
+        return pizza_type in self._types or (self.parent is not None and pizza_type in self.parent)
+
+
+PIZZA_TYPES: PizzaRegistry = PizzaRegistry()
+
+
+@PIZZA_TYPES.register('cheese', 'Cheese Pizza')
 class CheesePizza(Pizza):
+    ingredients: Tuple[str, ...] = ('dough', 'sauce', 'cheese')
+
     def __init__(self, ingredient_factory: PizzaIngredientFactory):
         self.ingredient_factory = ingredient_factory
         super(CheesePizza, self).__init__()
@@ -236,7 +471,10 @@ class CheesePizza(Pizza):
         self.cheese = self.ingredient_factory.create_cheese()
 
 
+@PIZZA_TYPES.register('veggie', 'Veggie Pizza')
 class VeggiePizza(Pizza):
+    ingredients: Tuple[str, ...] = ('dough', 'sauce', 'cheese', 'veggies')
+
     def __init__(self, ingredient_factory: PizzaIngredientFactory):
         self.ingredient_factory = ingredient_factory
         super(VeggiePizza, self).__init__()
@@ -249,7 +487,10 @@ class VeggiePizza(Pizza):
         self.veggies = self.ingredient_factory.create_veggies()
 
 
+@PIZZA_TYPES.register('clam', 'Clam Pizza')
 class ClamPizza(Pizza):
+    ingredients: Tuple[str, ...] = ('dough', 'sauce', 'cheese', 'clam')
+
     def __init__(self, ingredient_factory: PizzaIngredientFactory):
         self.ingredient_factory = ingredient_factory
         super(ClamPizza, self).__init__()
@@ -262,7 +503,10 @@ class ClamPizza(Pizza):
         self.clam = self.ingredient_factory.create_clam()
 
 
+@PIZZA_TYPES.register('pepperoni', 'Pepperoni Pizza')
 class PepperoniPizza(Pizza):
+    ingredients: Tuple[str, ...] = ('dough', 'sauce', 'cheese', 'veggies', 'pepperoni')
+
     def __init__(self, ingredient_factory: PizzaIngredientFactory):
         self.ingredient_factory = ingredient_factory
         super(PepperoniPizza, self).__init__()
@@ -277,62 +521,102 @@ class PepperoniPizza(Pizza):
 
 
 class PizzaStore(metaclass=ABCMeta):
+    ingredient_factory_class: Type[PizzaIngredientFactory]
+
+    def __init__(self, pool: Optional[PizzaPool] = None, inventory: Optional[Inventory] = None) -> None:
+        self.pool: Optional[PizzaPool] = pool
+        self.ingredient_factory: PizzaIngredientFactory = self.ingredient_factory_class(inventory=inventory)
+
+    def release(self, pizza: Pizza) -> None:
+        if self.pool is not None:
+            self.pool.release(pizza)
+
     @abstractmethod
     def create_pizza(self, item: str) -> Pizza:
         raise NotImplementedError('create_pizza method not implemented')
 
     def order_pizza(self, pizza_type: str) -> Pizza:
         pizza = self.create_pizza(pizza_type)
-        print(f'--- Making a {pizza.get_name()} ---')
-        pizza.prepare()
-        pizza.bake()
-        pizza.cut()
-        pizza.box()
+        try:
+            pizza.reserve_ingredients()
+        except OutOfStockError:
+            self.release(pizza)
+            raise
+        try:
+            print(f'--- Making a {pizza.get_name()} ---')
+            pizza.prepare()
+            pizza.bake()
+            pizza.cut()
+            pizza.box()
+        except Exception:
+            pizza.unreserve_ingredients()
+            self.release(pizza)
+            raise
         return pizza
 
+    def order_pizzas(
+        self,
+        pizza_types: Iterable[str],
+        batch_size: int = 256,
+        failures: Optional[List[Tuple[str, int, OutOfStockError]]] = None,
+    ) -> Iterator[Pizza]:
+        failed: List[Tuple[str, int, OutOfStockError]] = [] if failures is None else failures
+        orders: Iterator[str] = iter(pizza_types)
+        while True:
+            counts: Dict[str, int] = Counter(islice(orders, batch_size))
+            if not counts:
+                break
+            for pizza_type, count in counts.items():
+                prototype: Pizza = self.create_pizza(pizza_type)
+                try:
+                    prototype.reserve_ingredients(count)
+                except OutOfStockError as e:
+                    self.release(prototype)
+                    failed.append((pizza_type, count, e))
+                    continue
+                yield from self._make_group(prototype, count)
+        if failures is None and failed:
+            raise OutOfStockError('; '.join(f'{count} x {pizza_type} {e}' for pizza_type, count, e in failed))
+
+    def _make_group(self, prototype: Pizza, count: int) -> Iterator[Pizza]:
+        made: int = 0
+        pending: Optional[Pizza] = None
+        try:
+            print(f'--- Making {count} x {prototype.get_name()} ---')
+            prototype.prepare()
+            for n in range(count):
+                pending = prototype if n == count - 1 else prototype.clone()
+                pending.bake()
+                pending.cut()
+                pending.box()
+                pizza, pending = pending, None
+                made += 1
+                yield pizza
+        except BaseException:
+            prototype.unreserve_ingredients(count - made)
+            if made < count:
+                self.release(prototype)
+            if pending is not None and pending is not prototype:
+                self.release(pending)
+            raise
+
 
 class ChicagoPizzaStore(PizzaStore):
-    def create_pizza(self, item: str) -> Pizza:
-        ingredient_factory = ChicagoPizzaIngredientFactory()
-
-        if item == 'cheese':
-            pizza: Pizza = CheesePizza(ingredient_factory)
-            pizza.set_name('Chicago Style Cheese Pizza')
-        elif item == 'veggie':
-            pizza = VeggiePizza(ingredient_factory)
-            pizza.set_name('Chicago Style Veggie Pizza')
-        elif item == 'clam':
-            pizza = ClamPizza(ingredient_factory)
-            pizza.set_name('Chicago Style Clam Pizza')
-        elif item == 'pepperoni':
-            pizza = PepperoniPizza(ingredient_factory)
-            pizza.set_name('Chicago Style Pepperoni Pizza')
-        else:
-            raise Exception(f'no such kind pizza type: {item}')
+    style: str = 'Chicago Style'
+    pizza_types: PizzaRegistry = PizzaRegistry(PIZZA_TYPES)
+    ingredient_factory_class: Type[PizzaIngredientFactory] = ChicagoPizzaIngredientFactory
 
-        return pizza
+    def create_pizza(self, item: str) -> Pizza:
+        return self.pizza_types.create(item, self.ingredient_factory, self.style, self.pool)
 
 
 class NYPizzaStore(PizzaStore):
-    def create_pizza(self, item: str) -> Pizza:
-        ingredient_factory = NYPizzaIngredientFactory()
-
-        if item == 'cheese':
-            pizza: Pizza = CheesePizza(ingredient_factory)
-            pizza.set_name('New York Style Cheese Pizza')
-        elif item == 'veggie':
-            pizza = VeggiePizza(ingredient_factory)
-            pizza.set_name('New York Style Veggie Pizza')
-        elif item == 'clam':
-            pizza = ClamPizza(ingredient_factory)
-            pizza.set_name('New York Style Clam Pizza')
-        elif item == 'pepperoni':
-            pizza = PepperoniPizza(ingredient_factory)
-            pizza.set_name('New York Style Pepperoni Pizza')
-        else:
-            raise Exception(f'no such kind pizza type: {item}')
+    style: str = 'New York Style'
+    pizza_types: PizzaRegistry = PizzaRegistry(PIZZA_TYPES)
+    ingredient_factory_class: Type[PizzaIngredientFactory] = NYPizzaIngredientFactory
 
-        return pizza
+    def create_pizza(self, item: str) -> Pizza:
+        return self.pizza_types.create(item, self.ingredient_factory, self.style, self.pool)
 
 
 if __name__ == '__main__':
@@ -362,3 +646,8 @@ if __name__ == '__main__':
 
     pizza = chicago_store.order_pizza('veggie')
     print(f'Joel ordered a {pizza}\n')
+
+    print(INGREDIENT_POOL)
+
+    for pizza in ny_store.order_pizzas(['cheese', 'veggie', 'cheese', 'cheese']):
+        print(f'Lunch rush got a {pizza.get_name()}\n')
@@ -0,0 +1,45 @@
+import random
+import time
+from typing import Callable, Dict, List
+
+from factory_method import Pizza, PizzaRegistry
+
+LOOKUPS: int = 200_000
+
+
+def make_pizza_class(i: int) -> type:
+    def __init__(self) -> None:
+        Pizza.__init__(self, f'Pizza {i}', 'Thin Crust Dough', 'Marinara Sauce', [])
+    return type(f'Pizza{i}', (Pizza,), {'__init__': __init__})
+
+
+def make_ladder(classes: Dict[str, type]) -> Callable[[str], Pizza]:
+    lines: List[str] = ['def create_pizza(pizza_type):']
+    for n, pizza_type in enumerate(classes):
+        lines.append(f'    {"if" if n == 0 else "elif"} pizza_type == {pizza_type!r}:')
+        lines.append(f'        return classes[{pizza_type!r}]()')
+    lines.append("    raise Exception(f'no such kind pizza type: {pizza_type}')")
+    namespace: Dict[str, object] = {'classes': classes}
+    exec('\n'.join(lines), namespace)
+    return namespace['create_pizza']
+
+
+def timeit(create: Callable[[str], Pizza], orders: List[str]) -> float:
+    start: float = time.perf_counter()
+    for pizza_type in orders:
+        create(pizza_type)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    for size in (4, 50, 200, 800):
+        classes: Dict[str, type] = {f'pizza-{i}': make_pizza_class(i) for i in range(size)}
+        registry: PizzaRegistry = PizzaRegistry()
+        for pizza_type, pizza_class in classes.items():
+            registry.add(pizza_type, pizza_class)
+        orders: List[str] = random.choices(list(classes), k=LOOKUPS)
+
+        ladder: float = timeit(make_ladder(classes), orders)
+        dispatch: float = timeit(registry.create, orders)
+        print(f'{size:4d} types: if/elif {ladder:6.3f}s  registry {dispatch:6.3f}s  ({ladder / dispatch:5.2f}x)')
@@ -1,8 +1,16 @@
+import copy
 from abc import ABCMeta, abstractmethod
-from typing import List
+from collections import Counter
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+F = TypeVar('F', bound=Callable)
 
 
 class Pizza:
+    bake_minutes: int = 25
+    bake_temperature: int = 350
+
     def __init__(self, name: str, dough: str, sauce: str, toppings: List[str]) -> None:
         self.name = name
         self.dough = dough
@@ -21,7 +29,7 @@ class Pizza:
             print(f'    {topping}')
 
     def bake(self):
-        print('Bake for 25 minutes at 350')
+        print(f'Bake for {self.bake_minutes} minutes at {self.bake_temperature}')
 
     def cut(self):
         print('Cutting the pizza into diagonal slices')
@@ -29,12 +37,50 @@ class Pizza:
     def box(self):
         print('Place pizza in official PizzaStore box')
 
+    def clone(self) -> 'Pizza':
+        pizza: Pizza = copy.copy(self)
+        pizza.toppings = list(self.toppings)
+        return pizza
+
     def __str__(self):
         display = ['name: ', self.name, self.dough, self.sauce, 'toppings: ']
         display.extend(self.toppings)
         return '\n'.join(display)
 
 
+class PizzaRegistry:
+    def __init__(self, parent: Optional['PizzaRegistry'] = None) -> None:
+        self.parent: Optional[PizzaRegistry] = parent
+        self._factories: Dict[str, Callable[[], Pizza]] = {}
+
+    def add(self, pizza_type: str, factory: Callable[[], Pizza]) -> None:
+        self._factories[pizza_type] = factory
+
+    def register(self, pizza_type: str) -> Callable[[F], F]:
+        def decorator(factory: F) -> F:
+            self.add(pizza_type, factory)
+            return factory
+        return decorator
+
+    def get(self, pizza_type: str) -> Callable[[], Pizza]:
+        factory: Optional[Callable[[], Pizza]] = self._factories.get(pizza_type)
+        if factory is None:
+            if self.parent is None:
+                raise Exception(f'no such kind pizza type: {pizza_type}')
+            return self.parent.get(pizza_type)
+        return factory
+
+    def create(self, pizza_type: str) -> Pizza:
+        return self.get(pizza_type)()
+
+    def __contains__(self, pizza_type: str) -> bool:
+        return pizza_type in self._factories or (self.parent is not None and pizza_type in self.parent)
+
+
+CHICAGO_PIZZAS: PizzaRegistry = PizzaRegistry()
+NY_PIZZAS: PizzaRegistry = PizzaRegistry()
+
+
 class PizzaStore(metaclass=ABCMeta):
     @abstractmethod
     def create_pizza(self, pizza_type: str) -> Pizza:
@@ -49,7 +95,25 @@ class PizzaStore(metaclass=ABCMeta):
         pizza.box()
         return pizza
 
-
+    def order_pizzas(self, pizza_types: Iterable[str], batch_size: int = 256) -> Iterator[Pizza]:
+        orders: Iterator[str] = iter(pizza_types)
+        while True:
+            counts: Dict[str, int] = Counter(islice(orders, batch_size))
+            if not counts:
+                return
+            for pizza_type, count in counts.items():
+                prototype: Pizza = self.create_pizza(pizza_type)
+                print(f'--- Making {count} x {prototype.get_name()} ---')
+                prototype.prepare()
+                for n in range(count):
+                    pizza: Pizza = prototype if n == count - 1 else prototype.clone()
+                    pizza.bake()
+                    pizza.cut()
+                    pizza.box()
+                    yield pizza
+
+
+@CHICAGO_PIZZAS.register('cheese')
 class ChicagoStyleCheesePizza(Pizza):
     def __init__(self) -> None:
         name = 'Chicago Style Deep Dish Cheese Pizza'
@@ -62,6 +126,7 @@ class ChicagoStyleCheesePizza(Pizza):
         print('Cutting the pizza into square slices')
 
 
+@CHICAGO_PIZZAS.register('veggie')
 class ChicagoStyleVeggiePizza(Pizza):
     def __init__(self) -> None:
         name = 'Chicago Deep Dish Veggie Pizza'
@@ -74,6 +139,7 @@ class ChicagoStyleVeggiePizza(Pizza):
         print('Cutting the pizza into square slices')
 
 
+@CHICAGO_PIZZAS.register('clam')
 class ChicagoStyleClamPizza(Pizza):
     def __init__(self) -> None:
         name = 'Chicago Style Clam Pizza'
@@ -86,6 +152,7 @@ class ChicagoStyleClamPizza(Pizza):
         print('Cutting the pizza into square slices')
 
 
+@CHICAGO_PIZZAS.register('pepperoni')
 class ChicagoStylePepperoniPizza(Pizza):
     def __init__(self) -> None:
         name = 'Chicago Style Pepperoni Pizza'
@@ -98,6 +165,7 @@ class ChicagoStylePepperoniPizza(Pizza):
         print('Cutting the pizza into square slices')
 
 
+@NY_PIZZAS.register('cheese')
 class NYStyleCheesePizza(Pizza):
     def __init__(self) -> None:
         name = 'NY Style Sauce and Cheese Pizza'
@@ -107,6 +175,7 @@ class NYStyleCheesePizza(Pizza):
         super(NYStyleCheesePizza, self).__init__(name, dough, sauce, toppings)
 
 
+@NY_PIZZAS.register('veggie')
 class NYStyleVeggiePizza(Pizza):
     def __init__(self) -> None:
         name = 'NY Style Veggie Pizza'
@@ -116,6 +185,7 @@ class NYStyleVeggiePizza(Pizza):
         super(NYStyleVeggiePizza, self).__init__(name, dough, sauce, toppings)
 
 
+@NY_PIZZAS.register('clam')
 class NYStyleClamPizza(Pizza):
     def __init__(self) -> None:
         name = 'NY Style Clam Pizza'
@@ -125,6 +195,7 @@ class NYStyleClamPizza(Pizza):
         super(NYStyleClamPizza, self).__init__(name, dough, sauce, toppings)
 
 
+@NY_PIZZAS.register('pepperoni')
 class NYStylePepperoniPizza(Pizza):
     def __init__(self) -> None:
         name = 'NY Style Pepperoni Pizza'
@@ -135,63 +206,32 @@ class NYStylePepperoniPizza(Pizza):
 
 
 class ChicagoPizzaStore(PizzaStore):
+    pizza_types: PizzaRegistry = CHICAGO_PIZZAS
+
     def create_pizza(self, pizza_type: str):
-        if pizza_type == 'cheese':
-            return ChicagoStyleCheesePizza()
-        elif pizza_type == 'veggie':
-            return ChicagoStyleVeggiePizza()
-        elif pizza_type == 'clam':
-            return ChicagoStyleClamPizza()
-        elif pizza_type == 'pepperoni':
-            return ChicagoStylePepperoniPizza()
-        else:
-            raise Exception(f'no such kind pizza type: {pizza_type}')
+        return self.pizza_types.create(pizza_type)
 
 
 class NYPizzaStore(PizzaStore):
+    pizza_types: PizzaRegistry = NY_PIZZAS
+
     def create_pizza(self, pizza_type: str):
-        if pizza_type == 'cheese':
-            return NYStyleCheesePizza()
-        elif pizza_type == 'veggie':
-            return NYStyleVeggiePizza()
-        elif pizza_type == 'clam':
-            return NYStyleClamPizza()
-        elif pizza_type == 'pepperoni':
-            return NYStylePepperoniPizza()
-        else:
-            raise Exception(f'no such kind pizza type: {pizza_type}')
+        return self.pizza_types.create(pizza_type)
 
 
 class DependentPizzaStore:
+    STYLES: Dict[str, PizzaRegistry] = {'NY': NY_PIZZAS, 'Chicago': CHICAGO_PIZZAS}
+
     def __init__(self):
         pass
 
     def create_pizza(self, style: str, pizza_type: str):
-        if style == 'NY':
-            if pizza_type == 'cheese':
-                pizza: Pizza = NYStyleCheesePizza()
-            elif pizza_type == 'veggie':
-                pizza = NYStyleVeggiePizza()
-            elif pizza_type == 'clam':
-                pizza = NYStyleClamPizza()
-            elif pizza_type == 'pepperoni':
-                pizza = NYStylePepperoniPizza()
-            else:
-                raise Exception(f'no such kind pizza type: {pizza_type}')
-        elif style == 'Chicago':
-            if pizza_type == 'cheese':
-                pizza = ChicagoStyleCheesePizza()
-            elif pizza_type == 'veggie':
-                pizza = ChicagoStyleVeggiePizza()
-            elif pizza_type == 'clam':
-                pizza = ChicagoStyleClamPizza()
-            elif pizza_type == 'pepperoni':
-                pizza = ChicagoStylePepperoniPizza()
-            else:
-                raise Exception(f'no such kind pizza type: {pizza_type}')
-        else:
+        pizza_types: Optional[PizzaRegistry] = self.STYLES.get(style)
+        if pizza_types is None:
             print('Error: invalid type of pizza')
+            return
 
+        pizza: Pizza = pizza_types.create(pizza_type)
         pizza.prepare()
         pizza.bake()
         pizza.cut()
@@ -225,3 +265,6 @@ if __name__ == '__main__':
 
     pizza = chicago_store.order_pizza('veggie')
     print(f'Joel ordered a {pizza.get_name()}\n')
+
+    for pizza in ny_store.order_pizzas(['cheese', 'veggie', 'cheese', 'cheese']):
+        print(f'Lunch rush got a {pizza.get_name()}\n')
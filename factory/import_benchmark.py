@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+REGION_COUNTS = (1, 10, 50, 200)
+RUNS: int = 3
+
+REGION_TEMPLATE = """from factory_method import Pizza, PizzaRegistry, PizzaStore
+
+PIZZAS = PizzaRegistry()
+{pizzas}
+
+class Region{n}PizzaStore(PizzaStore):
+    pizza_types = PIZZAS
+
+    def create_pizza(self, pizza_type):
+        return self.pizza_types.create(pizza_type)
+"""
+
+PIZZA_TEMPLATE = """
+@PIZZAS.register('{kind}')
+class Region{n}{title}Pizza(Pizza):
+    def __init__(self):
+        super().__init__('Region {n} {title} Pizza', 'Thin Crust Dough', 'Marinara Sauce', ['Mozzarella'])
+"""
+
+ORDER = "import contextlib, io\nwith contextlib.redirect_stdout(io.StringIO()):\n    {store}.order_pizza('cheese')\n"
+
+
+def write_regions(directory: str, count: int) -> None:
+    for n in range(count):
+        pizzas: str = ''.join(
+            PIZZA_TEMPLATE.format(n=n, kind=kind, title=kind.title())
+            for kind in ('cheese', 'veggie', 'clam', 'pepperoni')
+        )
+        with open(os.path.join(directory, f'region_{n}.py'), 'w') as f:
+            f.write(REGION_TEMPLATE.format(n=n, pizzas=pizzas))
+
+
+def cold_start(code: str, path: List[str]) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path), PYTHONDONTWRITEBYTECODE='1')
+    best: float = float('inf')
+    for _ in range(RUNS):
+        start: float = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    here: str = os.path.dirname(os.path.abspath(__file__))
+    baseline: float = cold_start('pass', [here])
+    for count in REGION_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            write_regions(directory, count)
+            path: List[str] = [directory, here]
+            eager: str = ''.join(f'import region_{n}\n' for n in range(count))
+            eager += ORDER.format(store='region_0.Region0PizzaStore()')
+            lazy: str = 'from stores import StoreRegistry\nstores = StoreRegistry()\n'
+            lazy += ''.join(f"stores.register('r{n}', 'region_{n}:Region{n}PizzaStore')\n" for n in range(count))
+            lazy += ORDER.format(store="stores.get('r0')")
+            eager_time: float = cold_start(eager, path) - baseline
+            lazy_time: float = cold_start(lazy, path) - baseline
+        print(f'{count:4d} regions: eager import {eager_time * 1000:8.1f}ms  lazy registry {lazy_time * 1000:8.1f}ms')
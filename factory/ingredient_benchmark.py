@@ -0,0 +1,28 @@
+import contextlib
+import gc
+import io
+import time
+
+from abstract_factory import (
+    ChicagoPizzaIngredientFactory, FreshIngredientPool, IngredientPool, NYPizzaIngredientFactory, PepperoniPizza
+)
+
+ORDERS: int = 200_000
+
+
+def run(pool: IngredientPool) -> None:
+    factories = (NYPizzaIngredientFactory(pool), ChicagoPizzaIngredientFactory(pool))
+    pizzas = [PepperoniPizza(factories[i % 2]) for i in range(ORDERS)]
+    collections: int = sum(stat['collections'] for stat in gc.get_stats())
+    start: float = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for pizza in pizzas:
+            pizza.prepare()
+    elapsed: float = time.perf_counter() - start
+    collections = sum(stat['collections'] for stat in gc.get_stats()) - collections
+    print(f'{type(pool).__name__:<20} {elapsed:6.3f}s  {collections:4d} gc collections  {pool}')
+
+
+if __name__ == '__main__':
+    run(FreshIngredientPool())
+    run(IngredientPool())
@@ -0,0 +1,39 @@
+import threading
+import time
+from typing import Dict, List
+
+from abstract_factory import ChicagoPizzaIngredientFactory, Inventory, NYPizzaIngredientFactory, PIZZA_TYPES
+
+RESERVATIONS: int = 50_000
+THREADS = (1, 2, 4, 8)
+
+
+def run(stripes: int, threads: int) -> float:
+    inventory: Inventory = Inventory(stripes)
+    factories = (NYPizzaIngredientFactory(inventory=inventory), ChicagoPizzaIngredientFactory(inventory=inventory))
+    orders: List[Dict[str, int]] = [
+        factory.requirements(PIZZA_TYPES.get(pizza_type)[0].ingredients)
+        for factory in factories for pizza_type in ('cheese', 'veggie', 'clam', 'pepperoni')
+    ]
+    for order in orders:
+        inventory.restock({ingredient: amount * RESERVATIONS for ingredient, amount in order.items()})
+
+    def work(offset: int) -> None:
+        for i in range(offset, RESERVATIONS, threads):
+            inventory.reserve(orders[i % len(orders)])
+
+    workers: List[threading.Thread] = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+    start: float = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    for threads in THREADS:
+        single: float = run(1, threads)
+        striped: float = run(16, threads)
+        print(f'{threads} threads: one lock {RESERVATIONS / single:10,.0f}/s  '
+              f'16 stripes {RESERVATIONS / striped:10,.0f}/s')
@@ -0,0 +1,172 @@
+import contextlib
+import io
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional
+
+from factory_method import ChicagoPizzaStore, NYPizzaStore, Pizza, PizzaStore
+
+STAGES = ('prepare', 'bake', 'cut', 'box')
+
+
+class Order:
+    def __init__(self, pizza_type: str) -> None:
+        self.pizza_type: str = pizza_type
+        self.pizza: Optional[Pizza] = None
+        self.future: Future = Future()
+        self.created: float = time.perf_counter()
+        self.enqueued: float = self.created
+
+
+class StageStats:
+    def __init__(self, name: str, workers: int) -> None:
+        self.name: str = name
+        self.workers: int = workers
+        self.processed: int = 0
+        self.busy: float = 0.0
+        self.waited: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, waited: float, busy: float) -> None:
+        with self._lock:
+            self.processed += 1
+            self.waited += waited
+            self.busy += busy
+
+    def report(self, elapsed: float) -> str:
+        n: int = self.processed or 1
+        utilization: float = self.busy / (elapsed * self.workers) if elapsed else 0.0
+        return (
+            f'{self.name:<8} x{self.workers:<2} {self.processed:7d} done  '
+            f'wait {self.waited / n * 1000:8.3f}ms  service {self.busy / n * 1000:8.3f}ms  '
+            f'utilization {utilization:6.1%}'
+        )
+
+
+class OrderPipeline:
+    def __init__(
+        self,
+        store: PizzaStore,
+        workers: Optional[Dict[str, int]] = None,
+        queue_size: int = 32,
+        delays: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.store: PizzaStore = store
+        self.workers: Dict[str, int] = {stage: (workers or {}).get(stage, 1) for stage in STAGES}
+        self.delays: Dict[str, float] = delays or {}
+        self.queues: List[queue.Queue] = [queue.Queue(queue_size) for _ in STAGES]
+        self.stats: Dict[str, StageStats] = {stage: StageStats(stage, self.workers[stage]) for stage in STAGES}
+        self.latencies: List[float] = []
+        self._alive: Dict[str, int] = dict(self.workers)
+        self._lock: threading.Lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._started: float = 0.0
+        self._finished: float = 0.0
+
+    def start(self) -> 'OrderPipeline':
+        if self._threads:
+            raise RuntimeError('pipeline is already running, close it before starting it again')
+        self.stats = {stage: StageStats(stage, self.workers[stage]) for stage in STAGES}
+        self.latencies = []
+        self._alive = dict(self.workers)
+        self._finished = 0.0
+        self._started = time.perf_counter()
+        for position, stage in enumerate(STAGES):
+            for n in range(self.workers[stage]):
+                thread = threading.Thread(target=self._work, args=(position,), name=f'{stage}-{n}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def submit(self, pizza_type: str) -> Future:
+        order: Order = Order(pizza_type)
+        self.queues[0].put(order)
+        return order.future
+
+    def close(self) -> None:
+        for _ in range(self.workers[STAGES[0]]):
+            self.queues[0].put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._finished = time.perf_counter()
+
+    def run(self, pizza_types: Iterable[str]) -> List[Pizza]:
+        self.start()
+        futures: List[Future] = [self.submit(pizza_type) for pizza_type in pizza_types]
+        self.close()
+        return [future.result() for future in futures]
+
+    def _step(self, stage: str, order: Order) -> None:
+        if stage == 'prepare':
+            order.pizza = self.store.create_pizza(order.pizza_type)
+            print(f'--- Making a {order.pizza.get_name()} ---')
+        getattr(order.pizza, stage)()
+        delay: float = self.delays.get(stage, 0.0)
+        if delay:
+            time.sleep(delay)
+
+    def _work(self, position: int) -> None:
+        stage: str = STAGES[position]
+        inbox: queue.Queue = self.queues[position]
+        outbox: Optional[queue.Queue] = self.queues[position + 1] if position + 1 < len(STAGES) else None
+        stats: StageStats = self.stats[stage]
+        clock: Callable[[], float] = time.perf_counter
+        while True:
+            order: Optional[Order] = inbox.get()
+            if order is None:
+                break
+            start: float = clock()
+            try:
+                self._step(stage, order)
+            except Exception as e:
+                order.future.set_exception(e)
+                continue
+            finished: float = clock()
+            stats.record(start - order.enqueued, finished - start)
+            if outbox is None:
+                with self._lock:
+                    self.latencies.append(finished - order.created)
+                order.future.set_result(order.pizza)
+            else:
+                order.enqueued = finished
+                outbox.put(order)
+
+        with self._lock:
+            self._alive[stage] -= 1
+            last: bool = self._alive[stage] == 0
+        if last and outbox is not None:
+            for _ in range(self.workers[STAGES[position + 1]]):
+                outbox.put(None)
+
+    def report(self) -> str:
+        elapsed: float = (self._finished or time.perf_counter()) - self._started
+        lines: List[str] = [stats.report(elapsed) for stats in self.stats.values()]
+        bottleneck: StageStats = max(self.stats.values(), key=lambda s: s.busy / s.workers)
+        latencies: List[float] = sorted(self.latencies)
+        if latencies:
+            p50: float = latencies[len(latencies) // 2]
+            p99: float = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            lines.append(
+                f'{len(latencies)} pizzas in {elapsed:.3f}s ({len(latencies) / elapsed:,.0f}/s), '
+                f'latency p50 {p50 * 1000:.2f}ms p99 {p99 * 1000:.2f}ms, bottleneck: {bottleneck.name}'
+            )
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    pipeline: OrderPipeline = OrderPipeline(NYPizzaStore())
+    for pizza in pipeline.run(['cheese', 'veggie']):
+        print(f'Ethan ordered a {pizza.get_name()}\n')
+
+    kitchen: OrderPipeline = OrderPipeline(
+        ChicagoPizzaStore(),
+        workers={'prepare': 2, 'bake': 4, 'cut': 1, 'box': 1},
+        queue_size=8,
+        delays={'prepare': 0.002, 'bake': 0.005, 'cut': 0.0005, 'box': 0.0005},
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        kitchen.run(['cheese', 'veggie', 'clam', 'pepperoni'] * 100)
+    print(kitchen.report())
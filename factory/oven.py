@@ -0,0 +1,128 @@
+import contextlib
+import heapq
+import io
+import random
+import sys
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from factory_method import ChicagoPizzaStore, NYPizzaStore, Pizza, PizzaStore
+
+Arrival = Tuple[float, str]
+
+ARRIVE, PREPARED, BAKED, DONE = range(4)
+
+
+def poisson_arrivals(
+    orders_per_hour: float, hours: float, pizza_types: Sequence[str], seed: Optional[int] = None
+) -> Iterator[Arrival]:
+    rng: random.Random = random.Random(seed)
+    now: float = 0.0
+    while True:
+        now += rng.expovariate(orders_per_hour / 60)
+        if now > hours * 60:
+            return
+        yield now, rng.choice(pizza_types)
+
+
+class OvenScheduler:
+    def __init__(
+        self,
+        store: PizzaStore,
+        ovens: int = 2,
+        capacity: int = 4,
+        prepare_minutes: float = 5.0,
+        finish_minutes: float = 2.0,
+    ) -> None:
+        self.store: PizzaStore = store
+        self.ovens: int = ovens
+        self.capacity: int = capacity
+        self.prepare_minutes: float = prepare_minutes
+        self.finish_minutes: float = finish_minutes
+        self._reset()
+
+    def _reset(self) -> None:
+        self.latencies: List[float] = []
+        self.oven_waits: List[float] = []
+        self.busy_slot_minutes: float = 0.0
+        self.makespan: float = 0.0
+        self.max_queue: int = 0
+
+    def run(self, arrivals: Iterable[Arrival], verbose: bool = False) -> 'OvenScheduler':
+        self._reset()
+        with contextlib.ExitStack() as stack:
+            if not verbose:
+                stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            self._simulate(arrivals)
+        return self
+
+    def _simulate(self, arrivals: Iterable[Arrival]) -> None:
+        events: List[Tuple[float, int, int, int, Pizza]] = []
+        seq: int = 0
+        free_slots: int = self.ovens * self.capacity
+        waiting: Deque[Tuple[float, Pizza]] = deque()
+        arrived: Dict[int, float] = {}
+
+        for arrival, pizza_type in arrivals:
+            pizza: Pizza = self.store.create_pizza(pizza_type)
+            arrived[id(pizza)] = arrival
+            heapq.heappush(events, (arrival, seq, ARRIVE, 0, pizza))
+            seq += 1
+
+        while events:
+            now, _, kind, _, pizza = heapq.heappop(events)
+            if kind == ARRIVE:
+                print(f'--- Making a {pizza.get_name()} ---')
+                pizza.prepare()
+                heapq.heappush(events, (now + self.prepare_minutes, seq, PREPARED, 0, pizza))
+            elif kind == PREPARED:
+                waiting.append((now, pizza))
+                self.max_queue = max(self.max_queue, len(waiting))
+            elif kind == BAKED:
+                free_slots += 1
+                pizza.cut()
+                pizza.box()
+                heapq.heappush(events, (now + self.finish_minutes, seq, DONE, 0, pizza))
+            else:
+                self.latencies.append(now - arrived.pop(id(pizza)))
+                self.makespan = max(self.makespan, now)
+            seq += 1
+
+            while free_slots and waiting:
+                queued_at, ready = waiting.popleft()
+                free_slots -= 1
+                self.oven_waits.append(now - queued_at)
+                self.busy_slot_minutes += ready.bake_minutes
+                ready.bake()
+                heapq.heappush(events, (now + ready.bake_minutes, seq, BAKED, 0, ready))
+                seq += 1
+
+    @staticmethod
+    def _percentile(values: List[float], q: float) -> float:
+        if not values:
+            return 0.0
+        ordered: List[float] = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def report(self) -> str:
+        pizzas: int = len(self.latencies)
+        hours: float = self.makespan / 60 if self.makespan else 1.0
+        utilization: float = self.busy_slot_minutes / (self.ovens * self.capacity * self.makespan or 1.0)
+        return (
+            f'{self.ovens} ovens x {self.capacity}: {pizzas} pizzas, {pizzas / hours:.1f} pizzas/hour, '
+            f'oven utilization {utilization:.1%}, max queue {self.max_queue}\n'
+            f'  order latency p50/p90/p99 = '
+            f'{self._percentile(self.latencies, 0.5):.1f}/{self._percentile(self.latencies, 0.9):.1f}/'
+            f'{self._percentile(self.latencies, 0.99):.1f} min, '
+            f'oven wait p90 = {self._percentile(self.oven_waits, 0.9):.1f} min'
+        )
+
+
+if __name__ == '__main__':
+    OvenScheduler(NYPizzaStore(), ovens=1, capacity=1).run([(0, 'cheese'), (1, 'clam')], verbose=True)
+    print()
+
+    rate: float = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    for ovens in (1, 2, 3, 4):
+        arrivals: List[Arrival] = list(poisson_arrivals(rate, 8, ['cheese', 'veggie', 'clam', 'pepperoni'], seed=1))
+        print(OvenScheduler(ChicagoPizzaStore(), ovens=ovens, capacity=4).run(arrivals).report())
@@ -0,0 +1,59 @@
+import contextlib
+import gc
+import sys
+import time
+from typing import Optional
+
+from abstract_factory import ChicagoPizzaStore, NYPizzaStore, PizzaPool, PizzaStore
+
+PIZZA_TYPES = ('cheese', 'veggie', 'clam', 'pepperoni')
+
+
+class NullWriter:
+    def write(self, s: str) -> int:
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+
+def run(orders: int, pool: Optional[PizzaPool]) -> None:
+    stores = (NYPizzaStore(pool), ChicagoPizzaStore(pool))
+    if pool is not None:
+        for store in stores:
+            for pizza_type in PIZZA_TYPES:
+                pool.prewarm(store.pizza_types.get(pizza_type)[0], store.ingredient_factory, 4)
+
+    gc_time: float = 0.0
+    gc_started: float = 0.0
+
+    def on_gc(phase: str, info: dict) -> None:
+        nonlocal gc_time, gc_started
+        if phase == 'start':
+            gc_started = time.perf_counter()
+        else:
+            gc_time += time.perf_counter() - gc_started
+
+    collections: int = sum(stat['collections'] for stat in gc.get_stats())
+    gc.callbacks.append(on_gc)
+    start: float = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(NullWriter()):
+            for i in range(orders):
+                store: PizzaStore = stores[i & 1]
+                store.release(store.order_pizza(PIZZA_TYPES[i % 4]))
+    finally:
+        gc.callbacks.remove(on_gc)
+    elapsed: float = time.perf_counter() - start
+    collections = sum(stat['collections'] for stat in gc.get_stats()) - collections
+
+    label: str = 'pooled' if pool is not None else 'unpooled'
+    allocations: int = orders if pool is None else pool.misses
+    print(f'{label:<9} {elapsed:7.3f}s  {orders / elapsed:10,.0f} orders/s  {allocations:8d} pizza allocations  '
+          f'{collections:5d} gc collections  {gc_time * 1000:8.2f}ms in gc')
+
+
+if __name__ == '__main__':
+    orders: int = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run(orders, None)
+    run(orders, PizzaPool())
@@ -1,4 +1,6 @@
-from typing import List
+from typing import Callable, Dict, List, Optional, TypeVar
+
+F = TypeVar('F', bound=Callable)
 
 
 class Pizza:
@@ -26,6 +28,39 @@ class Pizza:
         return '\n'.join(display)
 
 
+class PizzaRegistry:
+    def __init__(self, parent: Optional['PizzaRegistry'] = None) -> None:
+        self.parent: Optional[PizzaRegistry] = parent
+        self._factories: Dict[str, Callable[[], Pizza]] = {}
+
+    def add(self, pizza_type: str, factory: Callable[[], Pizza]) -> None:
+        self._factories[pizza_type] = factory
+
+    def register(self, pizza_type: str) -> Callable[[F], F]:
+        def decorator(factory: F) -> F:
+            self.add(pizza_type, factory)
+            return factory
+        return decorator
+
+    def get(self, pizza_type: str) -> Callable[[], Pizza]:
+        factory: Optional[Callable[[], Pizza]] = self._factories.get(pizza_type)
+        if factory is None:
+            if self.parent is None:
+                raise Exception(f'no such kind pizza type: {pizza_type}')
+            return self.parent.get(pizza_type)
+        return factory
+
+    def create(self, pizza_type: str) -> Pizza:
+        return self.get(pizza_type)()
+
+    def __contains__(self, pizza_type: str) -> bool:
+        return pizza_type in self._factories or (self.parent is not None and pizza_type in self.parent)
+
+
+PIZZA_TYPES: PizzaRegistry = PizzaRegistry()
+
+
+@PIZZA_TYPES.register('cheese')
 class CheesePizza(Pizza):
     def __init__(self) -> None:
         name = 'Cheese Pizza'
@@ -35,6 +70,7 @@ class CheesePizza(Pizza):
         super(CheesePizza, self).__init__(name, dough, sauce, toppings)
 
 
+@PIZZA_TYPES.register('pepperoni')
 class PepperoniPizza(Pizza):
     def __init__(self) -> None:
         name = 'Pepperoni Pizza'
@@ -44,6 +80,7 @@ class PepperoniPizza(Pizza):
         super(PepperoniPizza, self).__init__(name, dough, sauce, toppings)
 
 
+@PIZZA_TYPES.register('clam')
 class ClamPizza(Pizza):
     def __init__(self) -> None:
         name = 'Pepperoni Pizza'
@@ -53,6 +90,7 @@ class ClamPizza(Pizza):
         super(ClamPizza, self).__init__(name, dough, sauce, toppings)
 
 
+@PIZZA_TYPES.register('veggie')
 class VeggiePizza(Pizza):
     def __init__(self) -> None:
         name = 'Veggie Pizza'
@@ -66,18 +104,11 @@ class VeggiePizza(Pizza):
 
 
 class SimplePizzaFactory:
+    pizza_types: PizzaRegistry = PIZZA_TYPES
+
     @staticmethod
     def create_pizza(pizza_type: str) -> Pizza:
-        if pizza_type == 'cheese':
-            return CheesePizza()
-        elif pizza_type == 'pepperoni':
-            return PepperoniPizza()
-        elif pizza_type == 'clam':
-            return ClamPizza()
-        elif pizza_type == 'veggie':
-            return VeggiePizza()
-        else:
-            raise Exception(f'no such kind pizza type: {pizza_type}')
+        return SimplePizzaFactory.pizza_types.create(pizza_type)
 
 
 class PizzaStore:
@@ -0,0 +1,63 @@
+import importlib
+import threading
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from factory_method import Pizza, PizzaStore
+
+
+class StoreRegistry:
+    def __init__(self) -> None:
+        self._specs: Dict[str, str] = {}
+        self._stores: Dict[str, 'PizzaStore'] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def register(self, region: str, spec: str) -> None:
+        if ':' not in spec:
+            raise ValueError(f'store spec must look like "module:StoreClass", got {spec!r}')
+        self._specs[region] = spec
+        self._stores.pop(region, None)
+
+    def get(self, region: str) -> 'PizzaStore':
+        store = self._stores.get(region)
+        if store is not None:
+            return store
+        with self._lock:
+            store = self._stores.get(region)
+            if store is None:
+                spec = self._specs.get(region)
+                if spec is None:
+                    raise Exception(f'no such region: {region}')
+                module_name, class_name = spec.split(':', 1)
+                store = getattr(importlib.import_module(module_name), class_name)()
+                self._stores[region] = store
+        return store
+
+    def order_pizza(self, region: str, pizza_type: str) -> 'Pizza':
+        return self.get(region).order_pizza(pizza_type)
+
+    def regions(self) -> List[str]:
+        return list(self._specs)
+
+    def loaded(self) -> List[str]:
+        return list(self._stores)
+
+    def __contains__(self, region: str) -> bool:
+        return region in self._specs
+
+
+STORES: StoreRegistry = StoreRegistry()
+STORES.register('NY', 'factory_method:NYPizzaStore')
+STORES.register('Chicago', 'factory_method:ChicagoPizzaStore')
+STORES.register('NY-Ingredients', 'abstract_factory:NYPizzaStore')
+STORES.register('Chicago-Ingredients', 'abstract_factory:ChicagoPizzaStore')
+
+
+if __name__ == '__main__':
+    import sys
+
+    print(f'regions: {STORES.regions()}, loaded: {STORES.loaded()}')
+    print(f'factory_method imported: {"factory_method" in sys.modules}')
+    pizza = STORES.order_pizza('NY', 'cheese')
+    print(f'Ethan ordered a {pizza.get_name()}\n')
+    print(f'loaded: {STORES.loaded()}, abstract_factory imported: {"abstract_factory" in sys.modules}')
@@ -1,6 +1,10 @@
+import heapq
+import math
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left, bisect_right, insort
 from collections.abc import Iterable
-from typing import List, Dict
+from itertools import count, islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 class MenuItem:
@@ -26,33 +30,152 @@ class MenuItem:
         return f'{self.name}, ${self.price}\n   {self.description}'
 
 
+MenuRow = Tuple[str, str, bool, float]
+
+
+def menu_item_at(items: List[Union[MenuItem, MenuRow]], position: int) -> MenuItem:
+    entry: Union[MenuItem, MenuRow] = items[position]
+    if isinstance(entry, MenuItem):
+        return entry
+    menu_item: MenuItem = MenuItem(*entry)
+    items[position] = menu_item
+    return menu_item
+
+
+SORT_KEYS: Dict[str, Callable[[MenuItem], object]] = {
+    'price': MenuItem.get_price,
+    'name': MenuItem.get_name,
+}
+
+
 class Menu(metaclass=ABCMeta):
+    indexes: Sequence['MenuIndex'] = ()
+    _sorted_items: Optional[Dict[str, List[MenuItem]]] = None
+
     @abstractmethod
     def create_iterator(self) -> Iterable[MenuItem]:
         raise NotImplementedError('`create_iterator` method not implemented')
 
+    def attach_index(self, index: 'MenuIndex') -> None:
+        self.indexes = [*self.indexes, index]
+        index.add_menu(self)
+
+    def create_sorted_iterator(self, key: str = 'price') -> Iterator[MenuItem]:
+        if self._sorted_items is None:
+            self._sorted_items = {}
+        items: Optional[List[MenuItem]] = self._sorted_items.get(key)
+        if items is None:
+            items = sorted(self.create_iterator(), key=SORT_KEYS[key])
+            self._sorted_items[key] = items
+        return iter(items)
+
+    def _item_added(self, menu_item: MenuItem) -> None:
+        self._sorted_items = None
+        for index in self.indexes:
+            index.add(self, menu_item)
+
+    def _items_added(self, menu_items: Sequence[MenuItem]) -> None:
+        self._sorted_items = None
+        for index in self.indexes:
+            index.add_many(self, menu_items)
+
+    def _item_removed(self, menu_item: MenuItem) -> None:
+        self._sorted_items = None
+        for index in self.indexes:
+            index.remove(self, menu_item)
+
+
+def merge_menus(menus: Iterable[Menu], key: str = 'price', limit: Optional[int] = None) -> Iterator[MenuItem]:
+    merged: Iterator[MenuItem] = heapq.merge(*(menu.create_sorted_iterator(key) for menu in menus), key=SORT_KEYS[key])
+    return merged if limit is None else islice(merged, limit)
+
+
+class MenuIndex:
+    def __init__(self) -> None:
+        self._menus: List[Menu] = []
+        self._by_name: Dict[str, List[MenuItem]] = {}
+        self._vegetarian_names: Dict[str, int] = {}
+        self._vegetarian: Dict[int, Dict[int, MenuItem]] = {}
+        self._by_price: List[Tuple[float, int, MenuItem]] = []
+        self._sequence: Dict[int, int] = {}
+        self._counter: Iterator[int] = count()
+
+    def add_menu(self, menu: Menu) -> None:
+        self._menus.append(menu)
+        self._vegetarian.setdefault(id(menu), {})
+        self.add_many(menu, menu.create_iterator())
+
+    def add(self, menu: Menu, menu_item: MenuItem) -> None:
+        insort(self._by_price, (menu_item.get_price(), self._add_lookups(menu, menu_item), menu_item))
+
+    def add_many(self, menu: Menu, menu_items: Iterable[MenuItem]) -> None:
+        entries: List[Tuple[float, int, MenuItem]] = []
+        for menu_item in menu_items:
+            entries.append((menu_item.get_price(), self._add_lookups(menu, menu_item), menu_item))
+        self._by_price.extend(entries)
+        self._by_price.sort()
+
+    def _add_lookups(self, menu: Menu, menu_item: MenuItem) -> int:
+        name: str = menu_item.get_name()
+        self._by_name.setdefault(name, []).append(menu_item)
+        if menu_item.is_vegetarian():
+            self._vegetarian_names[name] = self._vegetarian_names.get(name, 0) + 1
+            self._vegetarian[id(menu)][id(menu_item)] = menu_item
+        sequence: int = next(self._counter)
+        self._sequence[id(menu_item)] = sequence
+        return sequence
+
+    def remove(self, menu: Menu, menu_item: MenuItem) -> None:
+        name: str = menu_item.get_name()
+        items: List[MenuItem] = self._by_name[name]
+        items.remove(menu_item)
+        if not items:
+            del self._by_name[name]
+        if menu_item.is_vegetarian():
+            self._vegetarian_names[name] -= 1
+            if not self._vegetarian_names[name]:
+                del self._vegetarian_names[name]
+            del self._vegetarian[id(menu)][id(menu_item)]
+        sequence: int = self._sequence.pop(id(menu_item))
+        del self._by_price[bisect_left(self._by_price, (menu_item.get_price(), sequence))]
+
+    def lookup(self, name: str) -> List[MenuItem]:
+        return list(self._by_name.get(name, ()))
+
+    def is_vegetarian(self, name: str) -> bool:
+        return name in self._vegetarian_names
+
+    def vegetarian_items(self) -> Iterator[MenuItem]:
+        for menu in self._menus:
+            yield from self._vegetarian[id(menu)].values()
+
+    def items_by_price(self, low: float = -math.inf, high: float = math.inf) -> Iterator[MenuItem]:
+        start: int = bisect_left(self._by_price, (low,))
+        end: int = bisect_right(self._by_price, (high, math.inf))
+        for _, _, menu_item in self._by_price[start:end]:
+            yield menu_item
+
 
 class DinerMenuIterator:
-    def __init__(self, items: List[MenuItem]) -> None:
-        self.items: List[MenuItem] = items
+    def __init__(self, items: List[Union[MenuItem, MenuRow]], number_of_items: int) -> None:
+        self.items: List[Union[MenuItem, MenuRow]] = items
+        self.number_of_items: int = number_of_items
         self.position: int = 0
 
     def __iter__(self):
         return self
 
     def __next__(self) -> MenuItem:
-        if self.position > len(self.items) - 1:
+        if self.position >= self.number_of_items:
             raise StopIteration()
-        menu_item: MenuItem = self.items[self.position]
+        menu_item: MenuItem = menu_item_at(self.items, self.position)
         self.position += 1
         return menu_item
 
 
 class DinerMenu(Menu):
-    MAX_ITEMS: int = 6
-
     def __init__(self) -> None:
-        self.menu_items: List[MenuItem] = [None] * self.MAX_ITEMS
+        self.menu_items: List[Union[MenuItem, MenuRow]] = []
         self.number_of_items: int = 0
 
         self.add_item("Vegetarian BLT", "(Fakin') Bacon with lettuce & tomato on whole wheat", True, 2.99)
@@ -64,17 +187,26 @@ class DinerMenu(Menu):
 
     def add_item(self, name: str, description: str, vegetarian: bool, price: float) -> None:
         menu_item: MenuItem = MenuItem(name, description, vegetarian, price)
-        if self.number_of_items >= self.MAX_ITEMS:
-            print("Sorry, menu is full!  Can't add item to menu")
+        self.menu_items.append(menu_item)
+        self.number_of_items += 1
+        self._item_added(menu_item)
+
+    def add_items(self, rows: Iterable[MenuRow]) -> None:
+        start: int = self.number_of_items
+        self.menu_items.extend(rows)
+        self.number_of_items = len(self.menu_items)
+        if self.indexes:
+            self._items_added([menu_item_at(self.menu_items, i) for i in range(start, self.number_of_items)])
         else:
-            self.menu_items[self.number_of_items] = menu_item
-            self.number_of_items += 1
+            self._sorted_items = None
 
     def get_menu_items(self) -> List[MenuItem]:
+        for position in range(self.number_of_items):
+            menu_item_at(self.menu_items, position)
         return self.menu_items
 
     def create_iterator(self) -> Iterable[MenuItem]:
-        return DinerMenuIterator(self.menu_items)
+        return DinerMenuIterator(self.menu_items, self.number_of_items)
 
 
 class PancakeHouseMenuIterator:
@@ -104,6 +236,7 @@ class PancakeHouseMenu(Menu):
     def add_item(self, name: str, description: str, vegetarian: bool, price: float) -> None:
         menu_item: MenuItem = MenuItem(name, description, vegetarian, price)
         self.menu_items.append(menu_item)
+        self._item_added(menu_item)
 
     def get_menu_items(self) -> List[MenuItem]:
         return self.menu_items
@@ -126,7 +259,11 @@ class CafeMenu(Menu):
 
     def add_item(self, name: str, description: str, vegetarian: bool, price: float) -> None:
         menu_item: MenuItem = MenuItem(name, description, vegetarian, price)
+        replaced: MenuItem = self.menu_items.get(name)
+        if replaced is not None:
+            self._item_removed(replaced)
         self.menu_items.update({name: menu_item})
+        self._item_added(menu_item)
 
     def get_menu_items(self) -> Dict[str, MenuItem]:
         return self.menu_items
@@ -141,6 +278,9 @@ class Waitress:
         self.pancake_house_menu: Menu = pancake_house_menu
         self.diner_menu: Menu = diner_menu
         self.cafe_menu: Menu = cafe_menu
+        self.index: MenuIndex = MenuIndex()
+        for menu in (pancake_house_menu, diner_menu, cafe_menu):
+            menu.attach_index(self.index)
 
     def print_menu(self) -> None:
         pancake_iterator: Iterable[MenuItem] = self.pancake_house_menu.create_iterator()
@@ -160,34 +300,25 @@ class Waitress:
 
     def print_vegetarian_menu(self) -> None:
         print("\nVEGETARIAN MENU\n---------------")
-        self._print_vegetarian_menu(self.pancake_house_menu.create_iterator())
-        self._print_vegetarian_menu(self.diner_menu.create_iterator())
-        self._print_vegetarian_menu(self.cafe_menu.create_iterator())
+        self._print_vegetarian_menu(self.index.vegetarian_items())
 
     def is_item_vegetarian(self, name: str) -> bool:
-        breakfast_iterator: Iterable[MenuItem] = self.pancake_house_menu.create_iterator()
-        if self._is_vegetarian(name, breakfast_iterator):
-            return True
-        diner_iterator: Iterable[MenuItem] = self.diner_menu.create_iterator()
-        if self._is_vegetarian(name, diner_iterator):
-            return True
-        cafe_iterator: Iterable[MenuItem] = self.cafe_menu.create_iterator()
-        if self._is_vegetarian(name, cafe_iterator):
-            return True
-        return False
+        return self.index.is_vegetarian(name)
+
+    def merged_items(self, key: str = 'price', limit: Optional[int] = None) -> Iterator[MenuItem]:
+        return merge_menus((self.pancake_house_menu, self.diner_menu, self.cafe_menu), key, limit)
+
+    def print_sorted_menu(self, key: str = 'price', limit: Optional[int] = None) -> None:
+        self._print_menu(self.merged_items(key, limit))
+
+    def print_menu_by_price(self, low: float = -math.inf, high: float = math.inf) -> None:
+        self._print_menu(self.index.items_by_price(low, high))
 
     def _print_vegetarian_menu(self, iterator: Iterable[MenuItem]) -> None:
         for menu_item in iterator:
             if menu_item.is_vegetarian():
                 print(f'{menu_item.get_name()}, {menu_item.get_price()} -- {menu_item.get_description()}')
 
-    def _is_vegetarian(self, name: str, iterator: Iterable[MenuItem]) -> bool:
-        for menu_item in iterator:
-            if menu_item.get_name() == name:
-                if menu_item.is_vegetarian():
-                    return True
-        return False
-
 
 if __name__ == '__main__':
     pancake_house_menu: PancakeHouseMenu = PancakeHouseMenu()
@@ -198,6 +329,14 @@ if __name__ == '__main__':
     waitress.print_menu()
     waitress.print_vegetarian_menu()
 
+    cafe_menu.add_item("Soup of the day", "A cup of the vegetable soup of the day, with a side salad", True, 3.69)
+    print("\nCustomer asks, is the Soup of the day vegetarian?")
+    print(f"Waitress says: {'Yes' if waitress.is_item_vegetarian('Soup of the day') else 'No'}")
+    print("\nUNDER $3.50\n-----------")
+    waitress.print_menu_by_price(high=3.50)
+    print("\nFIRST FIVE BY NAME\n------------------")
+    waitress.print_sorted_menu('name', limit=5)
+
     print("\nCustomer asks, is the Hotdog vegetarian?")
     print("Waitress says: ")
     if waitress.is_item_vegetarian("Hotdog"):
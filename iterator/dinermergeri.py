@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable
-from typing import List
+from typing import List, Tuple, Union
 
 
 class MenuItem:
@@ -26,6 +26,18 @@ class MenuItem:
         return f'{self.name}, ${self.price}\n   {self.description}'
 
 
+MenuRow = Tuple[str, str, bool, float]
+
+
+def menu_item_at(items: List[Union[MenuItem, MenuRow]], position: int) -> MenuItem:
+    entry: Union[MenuItem, MenuRow] = items[position]
+    if isinstance(entry, MenuItem):
+        return entry
+    menu_item: MenuItem = MenuItem(*entry)
+    items[position] = menu_item
+    return menu_item
+
+
 class Menu(metaclass=ABCMeta):
     @abstractmethod
     def get_menu_items(self) -> List[MenuItem]:
@@ -37,26 +49,25 @@ class Menu(metaclass=ABCMeta):
 
 
 class DinerMenuIterator:
-    def __init__(self, items: List[MenuItem]) -> None:
-        self.items: List[MenuItem] = items
+    def __init__(self, items: List[Union[MenuItem, MenuRow]], number_of_items: int) -> None:
+        self.items: List[Union[MenuItem, MenuRow]] = items
+        self.number_of_items: int = number_of_items
         self.position: int = 0
 
     def __iter__(self):
         return self
 
     def __next__(self) -> MenuItem:
-        if self.position > len(self.items) - 1:
+        if self.position >= self.number_of_items:
             raise StopIteration()
-        menu_item: MenuItem = self.items[self.position]
+        menu_item: MenuItem = menu_item_at(self.items, self.position)
         self.position += 1
         return menu_item
 
 
 class DinerMenu(Menu):
-    MAX_ITEMS: int = 6
-
     def __init__(self) -> None:
-        self.menu_items: List[MenuItem] = [None] * self.MAX_ITEMS
+        self.menu_items: List[Union[MenuItem, MenuRow]] = []
         self.number_of_items: int = 0
 
         self.add_item("Vegetarian BLT", "(Fakin') Bacon with lettuce & tomato on whole wheat", True, 2.99)
@@ -68,17 +79,20 @@ class DinerMenu(Menu):
 
     def add_item(self, name: str, description: str, vegetarian: bool, price: float) -> None:
         menu_item: MenuItem = MenuItem(name, description, vegetarian, price)
-        if self.number_of_items >= self.MAX_ITEMS:
-            print("Sorry, menu is full!  Can't add item to menu")
-        else:
-            self.menu_items[self.number_of_items] = menu_item
-            self.number_of_items += 1
+        self.menu_items.append(menu_item)
+        self.number_of_items += 1
+
+    def add_items(self, rows: Iterable[MenuRow]) -> None:
+        self.menu_items.extend(rows)
+        self.number_of_items = len(self.menu_items)
 
     def get_menu_items(self) -> List[MenuItem]:
+        for position in range(self.number_of_items):
+            menu_item_at(self.menu_items, position)
         return self.menu_items
 
     def create_iterator(self) -> Iterable[MenuItem]:
-        return DinerMenuIterator(self.menu_items)
+        return DinerMenuIterator(self.menu_items, self.number_of_items)
 
 
 class PancakeHouseMenuIterator:
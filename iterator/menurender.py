@@ -0,0 +1,109 @@
+import io
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from dinermergercafe import CafeMenu, DinerMenu, MenuItem, PancakeHouseMenu, Waitress
+
+Row = Tuple[str, float, str]
+CHUNK_SIZE: int = 20_000
+
+
+def format_chunk(rows: List[Row]) -> bytes:
+    return ''.join([f'{name}, {price} -- {description}\n' for name, price, description in rows]).encode()
+
+
+def chunked(menu_items: Iterable[MenuItem], size: int) -> Iterator[List[Row]]:
+    rows: Iterator[Row] = (
+        (menu_item.get_name(), menu_item.get_price(), menu_item.get_description()) for menu_item in menu_items
+    )
+    while True:
+        chunk: List[Row] = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def render_sections(
+    sections: Iterable[Tuple[str, Iterable[MenuItem]]],
+    sink: BinaryIO,
+    executor: Optional[Executor] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    if isinstance(sink, io.BufferedIOBase):
+        _write_sections(sections, sink, executor, chunk_size)
+        return
+    out: io.BufferedWriter = io.BufferedWriter(sink)
+    try:
+        _write_sections(sections, out, executor, chunk_size)
+    finally:
+        out.detach()
+
+
+def _write_sections(
+    sections: Iterable[Tuple[str, Iterable[MenuItem]]],
+    out: io.BufferedIOBase,
+    executor: Optional[Executor],
+    chunk_size: int,
+) -> None:
+    for title, menu_items in sections:
+        out.write(title.encode())
+        chunks: Iterator[List[Row]] = chunked(menu_items, chunk_size)
+        mapper: Callable = map if executor is None else executor.map
+        rendered: Iterable[bytes] = mapper(format_chunk, chunks)
+        for data in rendered:
+            out.write(data)
+    out.flush()
+
+
+def render_menu(
+    waitress: Waitress, sink: BinaryIO, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> None:
+    sections: List[Tuple[str, Iterable[MenuItem]]] = [
+        ('MENU\n----\nBREAKFAST\n', waitress.pancake_house_menu.create_iterator()),
+        ('\nLUNCH\n', waitress.diner_menu.create_iterator()),
+        ('\nDINNER\n', waitress.cafe_menu.create_iterator()),
+    ]
+    if workers == 1:
+        render_sections(sections, sink, None, chunk_size)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        render_sections(sections, sink, executor, chunk_size)
+
+
+def benchmark(count: int = 1_000_000) -> None:
+    diner_menu: DinerMenu = DinerMenu()
+    diner_menu.add_items(
+        (f'Catalog item {i}', f'Description of catalog item number {i}', i % 3 == 0, round(1 + i % 1000 / 100, 2))
+        for i in range(count)
+    )
+    waitress: Waitress = Waitress(PancakeHouseMenu(), diner_menu, CafeMenu())
+
+    start: float = time.perf_counter()
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            waitress.print_menu()
+        finally:
+            sys.stdout = stdout
+    baseline: float = time.perf_counter() - start
+    print(f'print_menu        {baseline:7.3f}s')
+
+    workers: int = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        with open(os.devnull, 'wb') as sink:
+            render_menu(waitress, sink, workers)
+        elapsed: float = time.perf_counter() - start
+        print(f'render_menu x{workers:<3} {elapsed:7.3f}s  {baseline / elapsed:5.2f}x')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        render_menu(Waitress(PancakeHouseMenu(), DinerMenu(), CafeMenu()), sys.stdout.buffer)
@@ -0,0 +1,183 @@
+import tracemalloc
+from array import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from dinermerger import Iterator as MenuIterator, Menu, MenuItem
+
+
+class StringPool:
+    def __init__(self) -> None:
+        self._strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, s: str) -> int:
+        index: int = self._index.get(s, -1)
+        if index < 0:
+            index = len(self._strings)
+            self._strings.append(s)
+            self._index[s] = index
+        return index
+
+    def __getitem__(self, index: int) -> str:
+        return self._strings[index]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class MenuItemView:
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'MenuItemTable', index: int) -> None:
+        self._table: MenuItemTable = table
+        self._index: int = index
+
+    @property
+    def name(self) -> str:
+        return self._table.get_name(self._index)
+
+    @property
+    def description(self) -> str:
+        return self._table.get_description(self._index)
+
+    @property
+    def vegetarian(self) -> bool:
+        return self._table.is_vegetarian(self._index)
+
+    @property
+    def price(self) -> float:
+        return self._table.prices[self._index]
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_description(self) -> str:
+        return self.description
+
+    def get_price(self) -> float:
+        return self.price
+
+    def is_vegetarian(self) -> bool:
+        return self.vegetarian
+
+    def __str__(self) -> str:
+        return f'{self.name}, ${self.price}\n   {self.description}'
+
+
+class MenuItemTable:
+    def __init__(self) -> None:
+        self.strings: StringPool = StringPool()
+        self.names: array = array('I')
+        self.descriptions: array = array('I')
+        self.prices: array = array('d')
+        self.vegetarian: bytearray = bytearray()
+
+    def add_item(self, name: str, description: str, vegetarian: bool, price: float) -> int:
+        index: int = len(self.prices)
+        self.names.append(self.strings.intern(name))
+        self.descriptions.append(self.strings.intern(description))
+        self.prices.append(price)
+        if index % 8 == 0:
+            self.vegetarian.append(0)
+        if vegetarian:
+            self.vegetarian[index >> 3] |= 1 << (index & 7)
+        return index
+
+    def add_items(self, items: Iterable[Tuple[str, str, bool, float]]) -> None:
+        for name, description, vegetarian, price in items:
+            self.add_item(name, description, vegetarian, price)
+
+    def get_name(self, index: int) -> str:
+        return self.strings[self.names[index]]
+
+    def get_description(self, index: int) -> str:
+        return self.strings[self.descriptions[index]]
+
+    def is_vegetarian(self, index: int) -> bool:
+        return bool(self.vegetarian[index >> 3] >> (index & 7) & 1)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, index: int) -> MenuItemView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('menu item index out of range')
+        return MenuItemView(self, index)
+
+    def __iter__(self) -> Iterator[MenuItemView]:
+        return MenuItemTableIterator(self)
+
+
+class MenuItemTableIterator(MenuIterator):
+    def __init__(self, table: MenuItemTable) -> None:
+        self.table: MenuItemTable = table
+        self.position: int = 0
+
+    def has_next(self) -> bool:
+        return self.position < len(self.table)
+
+    def next(self) -> MenuItemView:
+        menu_item: MenuItemView = MenuItemView(self.table, self.position)
+        self.position += 1
+        return menu_item
+
+    def __iter__(self) -> 'MenuItemTableIterator':
+        return self
+
+    def __next__(self) -> MenuItemView:
+        if not self.has_next():
+            raise StopIteration()
+        return self.next()
+
+
+class TableMenu(Menu):
+    def __init__(self, table: MenuItemTable) -> None:
+        self.menu_items: MenuItemTable = table
+
+    def add_item(self, name: str, description: str, vegetarian: bool, price: float) -> None:
+        self.menu_items.add_item(name, description, vegetarian, price)
+
+    def get_menu_items(self) -> MenuItemTable:
+        return self.menu_items
+
+    def create_iterator(self) -> MenuItemTableIterator:
+        return MenuItemTableIterator(self.menu_items)
+
+
+def catalog(count: int) -> Iterator[Tuple[str, str, bool, float]]:
+    descriptions: List[str] = [f'House special number {i % 100}, served with a side' for i in range(100)]
+    for i in range(count):
+        yield f'Item {i}', descriptions[i % 100], i % 3 == 0, 1.0 + (i % 1000) / 100
+
+
+def measure(count: int) -> None:
+    tracemalloc.start()
+    items: List[MenuItem] = [MenuItem(*row) for row in catalog(count)]
+    objects: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+
+    tracemalloc.start()
+    table: MenuItemTable = MenuItemTable()
+    table.add_items(catalog(count))
+    columnar: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f'{count:>10,} items: MenuItem objects {objects / count:7.1f} B/item, '
+          f'MenuItemTable {columnar / count:7.1f} B/item ({objects / columnar:.2f}x smaller)')
+
+
+if __name__ == '__main__':
+    from dinermerger import PancakeHouseMenu, Waitress
+
+    diner_menu: TableMenu = TableMenu(MenuItemTable())
+    diner_menu.add_item("Vegetarian BLT", "(Fakin') Bacon with lettuce & tomato on whole wheat", True, 2.99)
+    diner_menu.add_item("BLT", "Bacon with lettuce & tomato on whole wheat", False, 2.99)
+    diner_menu.add_item("Pasta", "Spaghetti with Marinara Sauce, and a slice of sourdough bread", True, 3.89)
+    Waitress(PancakeHouseMenu(), diner_menu).print_menu()
+
+    print()
+    for n in (10_000, 100_000, 1_000_000):
+        measure(n)
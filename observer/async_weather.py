@@ -0,0 +1,175 @@
+import asyncio
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+from weather import CurrentConditionsDisplay, ForecastDisplay, Observer, StatisticsDisplay, Subject
+
+Reading = Tuple[float, float, float]
+
+
+class OverflowPolicy(Enum):
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop-oldest'
+    COALESCE_LATEST = 'coalesce-latest'
+
+
+class ObserverChannel:
+    def __init__(self, observer: Observer, maxsize: int, policy: OverflowPolicy) -> None:
+        self.observer: Observer = observer
+        self.policy: OverflowPolicy = policy
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.task: Optional[asyncio.Task] = None
+        self.closed: bool = False
+        self.dropped: int = 0
+        self.failed: int = 0
+        self.last_error: Optional[Exception] = None
+        self._space: asyncio.Event = asyncio.Event()
+
+    def start(self) -> None:
+        self.closed = False
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self._consume())
+
+    async def put(self, reading: Reading) -> None:
+        if self.policy is OverflowPolicy.BLOCK:
+            while self.queue.full() and not self.closed:
+                self._space.clear()
+                await self._space.wait()
+        if self.closed:
+            self.dropped += 1
+            return
+        if self.policy is OverflowPolicy.BLOCK:
+            self.queue.put_nowait(reading)
+            return
+        if self.queue.full():
+            if self.policy is OverflowPolicy.DROP_OLDEST:
+                self._discard(1)
+            else:
+                self._discard(self.queue.qsize())
+        self.queue.put_nowait(reading)
+
+    def _discard(self, count: int) -> None:
+        for _ in range(count):
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.dropped += 1
+        self._space.set()
+
+    async def _consume(self) -> None:
+        while True:
+            temp, humidity, pressure = await self.queue.get()
+            self._space.set()
+            try:
+                self.observer.update(temp, humidity, pressure)
+            except Exception as e:
+                self.failed += 1
+                self.last_error = e
+            finally:
+                self.queue.task_done()
+            await asyncio.sleep(0)
+
+    async def close(self, drain: bool = True) -> None:
+        self.closed = True
+        self._space.set()
+        if drain and self.task is not None and not self.task.done():
+            await self.queue.join()
+        task: Optional[asyncio.Task] = self.task
+        self.abort()
+        if task is not None:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def abort(self) -> None:
+        self.closed = True
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        self._discard(self.queue.qsize())
+
+
+class AsyncWeatherData(Subject):
+    def __init__(self, maxsize: int = 16, policy: OverflowPolicy = OverflowPolicy.BLOCK) -> None:
+        self._temperature: float
+        self._humidity: float
+        self._perssure: float
+        self._maxsize: int = maxsize
+        self._policy: OverflowPolicy = policy
+        self._channels: Dict[int, ObserverChannel] = {}
+        self._running: bool = False
+        self._closed: bool = False
+
+    def register_observer(
+        self, o: Observer, maxsize: Optional[int] = None, policy: Optional[OverflowPolicy] = None
+    ) -> None:
+        if id(o) in self._channels:
+            return
+        channel = ObserverChannel(o, self._maxsize if maxsize is None else maxsize, policy or self._policy)
+        self._channels[id(o)] = channel
+        if self._running:
+            channel.start()
+
+    def remove_observer(self, o: Observer) -> None:
+        channel: Optional[ObserverChannel] = self._channels.pop(id(o), None)
+        if channel is not None:
+            channel.abort()
+
+    def get_channel(self, o: Observer) -> ObserverChannel:
+        return self._channels[id(o)]
+
+    async def start(self) -> None:
+        self._running = True
+        self._closed = False
+        for channel in self._channels.values():
+            channel.start()
+
+    async def close(self, drain: bool = True) -> None:
+        self._running = False
+        self._closed = True
+        await asyncio.gather(*(channel.close(drain) for channel in list(self._channels.values())))
+
+    async def notify_observers(self) -> None:
+        reading: Reading = (self._temperature, self._humidity, self._perssure)
+        for channel in list(self._channels.values()):
+            await channel.put(reading)
+
+    async def measurements_changed(self) -> None:
+        await self.notify_observers()
+
+    async def set_measurements(self, temperature: float, humidity: float, perssure: float) -> None:
+        if self._closed:
+            raise RuntimeError('weather data is closed, start it again before setting measurements')
+        self._temperature = temperature
+        self._humidity = humidity
+        self._perssure = perssure
+        await self.measurements_changed()
+
+    def get_temperature(self) -> float:
+        return self._temperature
+
+    def get_humidity(self) -> float:
+        return self._humidity
+
+    def get_pressure(self) -> float:
+        return self._perssure
+
+
+async def main() -> None:
+    weather_data: AsyncWeatherData = AsyncWeatherData(maxsize=2)
+
+    CurrentConditionsDisplay(weather_data)
+    ForecastDisplay(weather_data)
+    statistics_display: StatisticsDisplay = StatisticsDisplay(weather_data)
+    weather_data.get_channel(statistics_display).policy = OverflowPolicy.COALESCE_LATEST
+
+    await weather_data.start()
+    await weather_data.set_measurements(80, 65, 30.4)
+    await weather_data.set_measurements(82, 70, 29.2)
+    await weather_data.set_measurements(78, 90, 29.2)
+    await weather_data.close()
+    print(f'Statistics display dropped {weather_data.get_channel(statistics_display).dropped} readings')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+import random
+import time
+from array import array
+from typing import Callable
+
+from weather import HeatIndexDisplay, WeatherData, compute_heat_index_batch, np
+
+READINGS: int = 1_000_000
+
+
+def timeit(label: str, func: Callable[[], object]) -> float:
+    start: float = time.perf_counter()
+    func()
+    elapsed: float = time.perf_counter() - start
+    print(f'{label:<12} {elapsed:8.3f}s  {READINGS / elapsed:14,.0f} readings/s')
+    return elapsed
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    temperatures: array = array('d', (random.uniform(70, 110) for _ in range(READINGS)))
+    humidities: array = array('d', (random.uniform(20, 100) for _ in range(READINGS)))
+    display: HeatIndexDisplay = HeatIndexDisplay(WeatherData())
+
+    print(f'{READINGS:,} readings, numpy {"available" if np is not None else "not available"}')
+    scalar: float = timeit(
+        'per-reading', lambda: [display.compute_heat_index(t, rh) for t, rh in zip(temperatures, humidities)]
+    )
+    batch: float = timeit('batch', lambda: compute_heat_index_batch(temperatures, humidities))
+    print(f'speedup      {scalar / batch:8.2f}x')
+
+    expected = [display.compute_heat_index(t, rh) for t, rh in zip(temperatures[:1000], humidities[:1000])]
+    actual = compute_heat_index_batch(temperatures[:1000], humidities[:1000])
+    assert all(abs(a - b) < 1e-9 for a, b in zip(expected, actual))
@@ -0,0 +1,161 @@
+import argparse
+import contextlib
+import csv
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from weather import (
+    ChangeFilter, CurrentConditionsDisplay, ForecastDisplay, HeatIndexDisplay, Observer, StatisticsDisplay, WeatherData
+)
+
+Reading = Tuple[float, float, float]
+RECORD: struct.Struct = struct.Struct('<ddd')
+
+
+class LatencyHistogram:
+    BUCKETS: int = 32
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * self.BUCKETS
+        self.total: int = 0
+        self.elapsed: float = 0.0
+        self.max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        micros: int = int(seconds * 1_000_000)
+        self.counts[min(micros.bit_length(), self.BUCKETS - 1)] += 1
+        self.total += 1
+        self.elapsed += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        rank: float = q * self.total
+        seen: int = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return (1 << bucket) / 1_000_000
+        return self.max
+
+    def __str__(self) -> str:
+        if not self.total:
+            return 'no samples'
+        return (
+            f'n={self.total} mean={self.elapsed / self.total * 1e6:.1f}us '
+            f'p50<={self.percentile(0.5) * 1e6:.0f}us p99<={self.percentile(0.99) * 1e6:.0f}us '
+            f'max={self.max * 1e6:.1f}us'
+        )
+
+
+class InstrumentedWeatherData(WeatherData):
+    def __init__(self, change_filter: Optional[ChangeFilter] = None) -> None:
+        super(InstrumentedWeatherData, self).__init__(change_filter=change_filter)
+        self.latencies: Dict[int, LatencyHistogram] = {}
+
+    def notify_observers(self) -> None:
+        clock = time.perf_counter
+        for observer in self._observers:
+            start: float = clock()
+            observer.update(self._temperature, self._humidity, self._perssure)
+            histogram: Optional[LatencyHistogram] = self.latencies.get(id(observer))
+            if histogram is None:
+                histogram = self.latencies[id(observer)] = LatencyHistogram()
+            histogram.add(clock() - start)
+
+
+def read_csv(path: str) -> Iterator[Reading]:
+    with open(path, newline='') as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith('#'):
+                continue
+            try:
+                yield float(row[0]), float(row[1]), float(row[2])
+            except ValueError:
+                continue
+
+
+def read_binary(path: str) -> Iterator[Reading]:
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            usable: int = len(mm) - len(mm) % RECORD.size
+            yield from RECORD.iter_unpack(memoryview(mm)[:usable])
+
+
+def read_readings(path: str) -> Iterator[Reading]:
+    return read_csv(path) if path.endswith('.csv') else read_binary(path)
+
+
+def write_synthetic(path: str, count: int, seed: int = 0) -> None:
+    rng: random.Random = random.Random(seed)
+    temp, humidity, pressure = 75.0, 60.0, 29.92
+    with open(path, 'wb') as f:
+        for _ in range(count):
+            temp = min(110.0, max(40.0, temp + rng.gauss(0, 0.2)))
+            humidity = min(100.0, max(5.0, humidity + rng.gauss(0, 0.5)))
+            pressure = min(31.0, max(28.0, pressure + rng.gauss(0, 0.01)))
+            f.write(RECORD.pack(temp, humidity, pressure))
+
+
+def replay(weather_data: WeatherData, readings: Iterator[Reading], rate: Optional[float] = None) -> Tuple[int, float]:
+    interval: float = 1.0 / rate if rate else 0.0
+    count: int = 0
+    start: float = time.perf_counter()
+    for temperature, humidity, pressure in readings:
+        if interval:
+            delay: float = start + count * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        weather_data.set_measurements(temperature, humidity, pressure)
+        count += 1
+    return count, time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Replay weather readings into WeatherData')
+    parser.add_argument('path', help='readings file: .csv with temp,humidity,pressure rows or packed <ddd records')
+    parser.add_argument('--rate', type=float, default=None, help='readings per second (default: as fast as possible)')
+    parser.add_argument('--generate', type=int, default=0, help='write N synthetic binary readings to path first')
+    parser.add_argument('--deadband', type=float, nargs=3, metavar=('TEMP', 'HUMIDITY', 'PRESSURE'),
+                        help='suppress notifications unless a field moves by more than its epsilon')
+    parser.add_argument('--min-interval', type=float, default=0.0, help='minimum seconds between notifications')
+    parser.add_argument('--verbose', action='store_true', help='keep observer output instead of discarding it')
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        write_synthetic(args.path, args.generate)
+
+    change_filter: Optional[ChangeFilter] = None
+    if args.deadband or args.min_interval:
+        change_filter = ChangeFilter(*(args.deadband or (0.0, 0.0, 0.0)), min_interval=args.min_interval)
+    weather_data: InstrumentedWeatherData = InstrumentedWeatherData(change_filter)
+    observers: List[Observer] = [
+        CurrentConditionsDisplay(weather_data),
+        StatisticsDisplay(weather_data),
+        ForecastDisplay(weather_data),
+        HeatIndexDisplay(weather_data),
+    ]
+
+    with contextlib.ExitStack() as stack:
+        if not args.verbose:
+            stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+        count, elapsed = replay(weather_data, read_readings(args.path), args.rate)
+        weather_data.flush()
+
+    print(f'{count} readings in {elapsed:.3f}s ({count / elapsed if elapsed else 0:,.0f} readings/s)', file=sys.stderr)
+    if change_filter is not None:
+        print(f'{change_filter.suppressed} notifications suppressed', file=sys.stderr)
+    for observer in observers:
+        print(f'{type(observer).__name__:<26} {weather_data.latencies.get(id(observer), LatencyHistogram())}',
+              file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
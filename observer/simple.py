@@ -1,5 +1,6 @@
+import weakref
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import Any, Dict, Iterator, Tuple
 
 
 class Observer(metaclass=ABCMeta):
@@ -22,13 +23,47 @@ class Subject(metaclass=ABCMeta):
         raise NotImplementedError('`remove_observer` method not implemented')
 
 
+class ObserverRegistry:
+    def __init__(self, weak: bool = False) -> None:
+        self._weak: bool = weak
+        self._observers: Dict[int, Any] = {}
+
+    def add(self, o: Observer) -> None:
+        key: int = id(o)
+        if key in self._observers:
+            return
+        if self._weak:
+            self._observers[key] = weakref.ref(o, lambda _, key=key: self._observers.pop(key, None))
+        else:
+            self._observers[key] = o
+
+    def remove(self, o: Observer) -> None:
+        if self._observers.pop(id(o), None) is None:
+            raise ValueError(f'{o!r} is not registered')
+
+    def snapshot(self) -> Tuple[Observer, ...]:
+        if not self._weak:
+            return tuple(self._observers.values())
+        observers = (ref() for ref in tuple(self._observers.values()))
+        return tuple(o for o in observers if o is not None)
+
+    def __iter__(self) -> Iterator[Observer]:
+        return iter(self.snapshot())
+
+    def __contains__(self, o: Observer) -> bool:
+        return id(o) in self._observers
+
+    def __len__(self) -> int:
+        return len(self._observers)
+
+
 class SimpleSubject(Subject):
-    def __init__(self) -> None:
-        self._observers: List[Observer] = []
+    def __init__(self, weak: bool = False) -> None:
+        self._observers: ObserverRegistry = ObserverRegistry(weak)
         self._value: int = 0
 
     def register_observer(self, o: Observer) -> None:
-        self._observers.append(o)
+        self._observers.add(o)
 
     def remove_observer(self, o: Observer) -> None:
         self._observers.remove(o)
@@ -1,5 +1,21 @@
+import math
+import time
+import weakref
 from abc import ABCMeta, abstractmethod
-from typing import List, Optional
+from array import array
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HEAT_INDEX_COEFFICIENTS = (
+    (16.923, 0.185212, 0.00941695, -0.000038646),
+    (5.37941, -0.100254, 0.000345372, 0.00000142721),
+    (0.00728898, -0.000814971, 0.0000102102, -0.0000000218429),
+    (0.0000291583, 0.000000197483, 0.000000000843296, -0.0000000000481975),
+)
 
 
 class Observer(metaclass=ABCMeta):
@@ -7,6 +23,10 @@ class Observer(metaclass=ABCMeta):
     def update(self, temp: float, humidity: float, perssure: float) -> None:
         raise NotImplementedError('`update` method not implemented')
 
+    def update_batch(self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]) -> None:
+        for temp, humidity, pressure in zip(temps, humidities, pressures):
+            self.update(temp, humidity, pressure)
+
 
 class Subject(metaclass=ABCMeta):
     @abstractmethod
@@ -22,20 +42,96 @@ class Subject(metaclass=ABCMeta):
         raise NotImplementedError('`remove_observer` method not implemented')
 
 
+class ObserverRegistry:
+    def __init__(self, weak: bool = False) -> None:
+        self._weak: bool = weak
+        self._observers: Dict[int, Any] = {}
+
+    def add(self, o: Observer) -> None:
+        key: int = id(o)
+        if key in self._observers:
+            return
+        if self._weak:
+            self._observers[key] = weakref.ref(o, lambda _, key=key: self._observers.pop(key, None))
+        else:
+            self._observers[key] = o
+
+    def remove(self, o: Observer) -> None:
+        if self._observers.pop(id(o), None) is None:
+            raise ValueError(f'{o!r} is not registered')
+
+    def snapshot(self) -> Tuple[Observer, ...]:
+        if not self._weak:
+            return tuple(self._observers.values())
+        observers = (ref() for ref in tuple(self._observers.values()))
+        return tuple(o for o in observers if o is not None)
+
+    def __iter__(self) -> Iterator[Observer]:
+        return iter(self.snapshot())
+
+    def __contains__(self, o: Observer) -> bool:
+        return id(o) in self._observers
+
+    def __len__(self) -> int:
+        return len(self._observers)
+
+
 class DisplayElement(metaclass=ABCMeta):
     def display(self) -> None:
         raise NotImplementedError('`display` method not implemented')
 
 
+class ChangeFilter:
+    def __init__(
+        self,
+        temperature_epsilon: float = 0.0,
+        humidity_epsilon: float = 0.0,
+        pressure_epsilon: float = 0.0,
+        min_interval: float = 0.0,
+        coalesce: bool = True,
+    ) -> None:
+        self.epsilons: Tuple[float, float, float] = (temperature_epsilon, humidity_epsilon, pressure_epsilon)
+        self.min_interval: float = min_interval
+        self.coalesce: bool = coalesce
+        self.pending: bool = False
+        self.suppressed: int = 0
+        self._last_reading: Optional[Tuple[float, float, float]] = None
+        self._last_notified: float = -math.inf
+
+    def _changed(self, reading: Tuple[float, float, float]) -> bool:
+        if self._last_reading is None:
+            return True
+        return any(abs(new - old) > eps for new, old, eps in zip(reading, self._last_reading, self.epsilons))
+
+    def should_notify(self, reading: Tuple[float, float, float], now: Optional[float] = None) -> bool:
+        changed: bool = self._changed(reading) or (self.coalesce and self.pending)
+        if not changed:
+            self.suppressed += 1
+            return False
+        now = time.monotonic() if now is None else now
+        if now - self._last_notified < self.min_interval:
+            self.pending = self.coalesce
+            self.suppressed += 1
+            return False
+        self.mark_notified(reading, now)
+        return True
+
+    def mark_notified(self, reading: Tuple[float, float, float], now: Optional[float] = None) -> None:
+        self._last_reading = reading
+        self._last_notified = time.monotonic() if now is None else now
+        self.pending = False
+
+
 class WeatherData(Subject):
-    def __init__(self) -> None:
+    def __init__(self, weak: bool = False, change_filter: Optional[ChangeFilter] = None) -> None:
         self._temperature: float
         self._humidity: float
         self._perssure: float
-        self._observers: List[Observer] = []
+        self._observers: ObserverRegistry = ObserverRegistry(weak)
+        self._change_filter: Optional[ChangeFilter] = change_filter
 
     def register_observer(self, o: Observer) -> None:
-        self._observers.append(o)
+        self._observers.add(o)
 
     def remove_observer(self, o: Observer) -> None:
         self._observers.remove(o)
@@ -44,8 +140,22 @@ class WeatherData(Subject):
         for observer in self._observers:
             observer.update(self._temperature, self._humidity, self._perssure)
 
+    def notify_observers_batch(
+        self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]
+    ) -> None:
+        for observer in self._observers:
+            observer.update_batch(temps, humidities, pressures)
+
     def measurements_changed(self) -> None:
-        self.notify_observers()
+        change_filter: Optional[ChangeFilter] = self._change_filter
+        if change_filter is None or change_filter.should_notify((self._temperature, self._humidity, self._perssure)):
+            self.notify_observers()
+
+    def flush(self) -> None:
+        change_filter: Optional[ChangeFilter] = self._change_filter
+        if change_filter is not None and change_filter.pending:
+            change_filter.mark_notified((self._temperature, self._humidity, self._perssure))
+            self.notify_observers()
 
     def set_measurements(self, temperature: float, humidity: float, perssure: float) -> None:
         self._temperature = temperature
@@ -53,6 +163,20 @@ class WeatherData(Subject):
         self._perssure = perssure
         self.measurements_changed()
 
+    def set_measurements_batch(
+        self, temperatures: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]
+    ) -> None:
+        if not len(temperatures) == len(humidities) == len(pressures):
+            raise ValueError('temperatures, humidities and pressures must have the same length')
+        if len(temperatures) == 0:
+            return
+        self._temperature = temperatures[-1]
+        self._humidity = humidities[-1]
+        self._perssure = pressures[-1]
+        if self._change_filter is not None:
+            self._change_filter.mark_notified((self._temperature, self._humidity, self._perssure))
+        self.notify_observers_batch(temperatures, humidities, pressures)
+
     def get_temperature(self) -> float:
         return self._temperature
 
@@ -75,6 +199,11 @@ class ForecastDisplay(Observer, DisplayElement):
         self._current_pressure = perssure
         self.display()
 
+    def update_batch(self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]) -> None:
+        self._last_pressure = pressures[-2] if len(pressures) > 1 else self._current_pressure
+        self._current_pressure = pressures[-1]
+        self.display()
+
     def display(self) -> None:
         print('Forecast: ')
         if self._current_pressure > self._last_pressure:
@@ -97,6 +226,11 @@ class CurrentConditionsDisplay(Observer, DisplayElement):
         self._humidity = humidity
         self.display()
 
+    def update_batch(self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]) -> None:
+        self._temperature = temps[-1]
+        self._humidity = humidities[-1]
+        self.display()
+
     def display(self) -> None:
         print(f'Current conditions: {self._temperature} F degrees and {self._humidity}% humidity')
 
@@ -120,6 +254,13 @@ class StatisticsDisplay(Observer, DisplayElement):
 
         self.display()
 
+    def update_batch(self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]) -> None:
+        self._temp_sum += sum(temps)
+        self._num_readings += len(temps)
+        self._max_temp = max(self._max_temp, max(temps))
+        self._min_temp = min(self._min_temp, min(temps))
+        self.display()
+
     def display(self) -> None:
         print(f'Avg/Max/Min temperature = {self._temp_sum / self._num_readings}/{self._max_temp}/{self._min_temp}')
 
@@ -134,6 +275,10 @@ class HeatIndexDisplay(Observer, DisplayElement):
         self._heat_index = self.compute_heat_index(t, rh)
         self.display()
 
+    def update_batch(self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]) -> None:
+        self._heat_index = self.compute_heat_index(temps[-1], humidities[-1])
+        self.display()
+
     def compute_heat_index(self, t: float, rh: float) -> float:
         index: float = (
             (16.923 + (0.185212 * t) + (5.37941 * rh) - (0.100254 * t * rh) + (0.00941695 * (t * t)) + (
@@ -146,10 +291,39 @@ class HeatIndexDisplay(Observer, DisplayElement):
         )
         return index
 
+    def compute_heat_index_batch(self, t: Sequence[float], rh: Sequence[float]):
+        return compute_heat_index_batch(t, rh)
+
     def display(self) -> None:
         print(f'Heat index is {self._heat_index}')
 
 
+def _horner(coefficients: Sequence[float], x):
+    c0, c1, c2, c3 = coefficients
+    return ((c3 * x + c2) * x + c1) * x + c0
+
+
+def compute_heat_index_batch(t: Sequence[float], rh: Sequence[float]) -> Union['np.ndarray', array]:
+    if len(t) != len(rh):
+        raise ValueError('temperature and humidity must have the same length')
+
+    if np is not None:
+        t = np.asarray(t, dtype=np.float64)
+        rh = np.asarray(rh, dtype=np.float64)
+        a0, a1, a2, a3 = (_horner(c, t) for c in HEAT_INDEX_COEFFICIENTS)
+        return ((a3 * rh + a2) * rh + a1) * rh + a0
+
+    (b0, b1, b2, b3), (c0, c1, c2, c3), (d0, d1, d2, d3), (e0, e1, e2, e3) = HEAT_INDEX_COEFFICIENTS
+    result: array = array('d', bytes(8 * len(t)))
+    for i, (x, y) in enumerate(zip(t, rh)):
+        a0 = ((b3 * x + b2) * x + b1) * x + b0
+        a1 = ((c3 * x + c2) * x + c1) * x + c0
+        a2 = ((d3 * x + d2) * x + d1) * x + d0
+        a3 = ((e3 * x + e2) * x + e1) * x + e0
+        result[i] = ((a3 * y + a2) * y + a1) * y + a0
+    return result
+
+
 if __name__ == '__main__':
     weather_data: WeatherData = WeatherData()
 
@@ -161,3 +335,5 @@ if __name__ == '__main__':
     weather_data.set_measurements(80, 65, 30.4)
     weather_data.set_measurements(82, 70, 29.2)
     weather_data.set_measurements(78, 90, 29.2)
+
+    weather_data.set_measurements_batch([80, 82, 78], [65, 70, 90], [30.4, 29.2, 29.2])
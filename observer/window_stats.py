@@ -0,0 +1,239 @@
+import math
+import time
+import warnings
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from weather import DisplayElement, Observer, WeatherData
+
+
+class P2Quantile:
+    def __init__(self, q: float) -> None:
+        if not 0 < q < 1:
+            raise ValueError('quantile must be between 0 and 1')
+        self.q: float = q
+        self._heights: List[float] = []
+        self._positions: List[int] = [1, 2, 3, 4, 5]
+        self._desired: List[float] = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments: Tuple[float, ...] = (0, q / 2, q, (1 + q) / 2, 1)
+
+    def add(self, x: float) -> None:
+        heights: List[float] = self._heights
+        if len(heights) < 5:
+            insort(heights, x)
+            return
+
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = bisect_right(heights, x, 0, 4) - 1
+        for i in range(k + 1, 5):
+            self._positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d: float = self._desired[i] - self._positions[i]
+            if (d >= 1 and self._positions[i + 1] - self._positions[i] > 1) or (
+                d <= -1 and self._positions[i - 1] - self._positions[i] < -1
+            ):
+                step: int = 1 if d > 0 else -1
+                height: float = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                self._positions[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        n, h = self._positions, self._heights
+        return h[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, d: int) -> float:
+        n, h = self._positions, self._heights
+        return h[i] + d * (h[i + d] - h[i]) / (n[i + d] - n[i])
+
+    def value(self) -> float:
+        heights: List[float] = self._heights
+        if not heights:
+            return math.nan
+        if len(heights) < 5:
+            return heights[min(len(heights) - 1, int(self.q * len(heights)))]
+        return heights[2]
+
+
+class WindowedStatistics:
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        duration: Optional[float] = None,
+        max_size: int = 100_000,
+        exact_percentiles: bool = False,
+    ) -> None:
+        if size is None and duration is None:
+            raise ValueError('either a count window `size` or a time window `duration` is required')
+        if size is not None and size < 1:
+            raise ValueError('window `size` must be at least 1')
+        if max_size < 1:
+            raise ValueError('`max_size` must be at least 1')
+        if size is not None and size > max_size:
+            raise ValueError(f'window `size` {size} exceeds `max_size` {max_size}')
+        self.size: int = size if size is not None else max_size
+        self.duration: Optional[float] = duration
+        self.truncated: int = 0
+        self._time_only: bool = size is None
+        self._seq: int = 0
+        self._window: Deque[Tuple[float, int, float]] = deque()
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        self._sorted: Optional[List[float]] = [] if exact_percentiles else None
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        now: float = time.monotonic() if timestamp is None else timestamp
+        self.expire(now)
+        if len(self._window) >= self.size:
+            if self._time_only:
+                self._truncate()
+            self._evict()
+
+        seq: int = self._seq
+        self._seq += 1
+        self._window.append((now, seq, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+        if self._sorted is not None:
+            insort(self._sorted, value)
+
+        delta: float = value - self._mean
+        self._mean += delta / len(self._window)
+        self._m2 += delta * (value - self._mean)
+
+    def _truncate(self) -> None:
+        if not self.truncated:
+            warnings.warn(
+                f'more than {self.size} readings inside the {self.duration}s window, '
+                f'the oldest ones are evicted before they expire',
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        self.truncated += 1
+
+    def expire(self, now: Optional[float] = None) -> None:
+        if self.duration is None:
+            return
+        horizon: float = (time.monotonic() if now is None else now) - self.duration
+        while self._window and self._window[0][0] <= horizon:
+            self._evict()
+
+    def _evict(self) -> None:
+        _, seq, value = self._window.popleft()
+        if self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max[0][0] == seq:
+            self._max.popleft()
+        if self._sorted is not None:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+        n: int = len(self._window)
+        if n == 0:
+            self._mean = self._m2 = 0.0
+            return
+        delta: float = value - self._mean
+        self._mean -= delta / n
+        self._m2 = max(0.0, self._m2 - delta * (value - self._mean))
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def is_truncated(self) -> bool:
+        return bool(self._window) and self._time_only and self.truncated > 0 and len(self._window) >= self.size
+
+    def mean(self) -> float:
+        return self._mean if self._window else math.nan
+
+    def variance(self) -> float:
+        return self._m2 / (len(self._window) - 1) if len(self._window) > 1 else 0.0
+
+    def stddev(self) -> float:
+        return math.sqrt(self.variance())
+
+    def min(self) -> float:
+        return self._min[0][1] if self._min else math.nan
+
+    def max(self) -> float:
+        return self._max[0][1] if self._max else math.nan
+
+    def percentile(self, q: float) -> float:
+        if self._sorted is None:
+            raise ValueError('window percentiles need WindowedStatistics(exact_percentiles=True)')
+        if not self._sorted:
+            return math.nan
+        return self._sorted[min(len(self._sorted) - 1, int(q * len(self._sorted)))]
+
+
+class WindowedStatisticsDisplay(Observer, DisplayElement):
+    def __init__(
+        self,
+        weather_data: WeatherData,
+        size: Optional[int] = None,
+        duration: Optional[float] = None,
+        quantiles: Sequence[float] = (0.5, 0.95),
+        exact_percentiles: bool = False,
+    ) -> None:
+        self._window: WindowedStatistics = WindowedStatistics(size, duration, exact_percentiles=exact_percentiles)
+        self._exact_percentiles: bool = exact_percentiles
+        self._sketches: List[P2Quantile] = [P2Quantile(q) for q in quantiles]
+        self._weather_data: WeatherData = weather_data
+        self._weather_data.register_observer(self)
+
+    def update(self, temp: float, humidity: float, perssure: float) -> None:
+        self._window.add(temp)
+        for sketch in self._sketches:
+            sketch.add(temp)
+        self.display()
+
+    def update_batch(self, temps: Sequence[float], humidities: Sequence[float], pressures: Sequence[float]) -> None:
+        for temp in temps:
+            self._window.add(temp)
+            for sketch in self._sketches:
+                sketch.add(temp)
+        self.display()
+
+    def display(self) -> None:
+        window: WindowedStatistics = self._window
+        window.expire()
+        print(
+            f'Window Avg/Max/Min/Stddev temperature = '
+            f'{window.mean():.2f}/{window.max()}/{window.min()}/{window.stddev():.2f} over {len(window)} readings'
+        )
+        if window.truncated:
+            print(f'  window capped at {window.size} readings, {window.truncated} evicted before they expired')
+        for sketch in self._sketches:
+            line: str = f'  lifetime p{sketch.q * 100:g} = {sketch.value():.2f}'
+            if self._exact_percentiles:
+                line += f', window p{sketch.q * 100:g} = {window.percentile(sketch.q)}'
+            print(line)
+
+
+if __name__ == '__main__':
+    weather_data: WeatherData = WeatherData()
+    windowed_display: WindowedStatisticsDisplay = WindowedStatisticsDisplay(
+        weather_data, size=2, exact_percentiles=True
+    )
+
+    weather_data.set_measurements(80, 65, 30.4)
+    weather_data.set_measurements(82, 70, 29.2)
+    weather_data.set_measurements(78, 90, 29.2)